@@ -2,12 +2,28 @@ import os
 import subprocess
 import re
 import shutil
+import sys
+import contextlib
+import functools
+import json
+import mmap
+import time
+import weakref
 from pathlib import Path
 import pandas as pd
 import h5py
 import numpy as np
 import matplotlib.pyplot as plt
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:
+    MinMaxLTTBDownsampler = None
 
 
 
@@ -27,14 +43,15 @@ Session 2.1: Command Line Automation of HEC-RAS with Python
 | get_flow_entries | Get all flow entries from a project file. | project_file (str) | pd.DataFrame: A DataFrame containing flow numbers for all flow files in the project |
 | get_unsteady_entries | Get all unsteady flow entries from a project file. | project_file (str) | pd.DataFrame: A DataFrame containing unsteady numbers for all unsteady flow files in the project |
 | get_geom_entries | Get all geometry entries from a project file. | project_file (str) | pd.DataFrame: A DataFrame containing geometry numbers for all geometry files in the project |
+| clear_project_cache | Clear cached project file parses used by the get_*_entries methods. | project_file (str, optional) | None |
 | copy_geometry_from_template | Copy geometry files from a template, find the next geometry number, and update the project file accordingly. | project_folder (str), project_file (str), template_geom (str) | str: New geometry number (e.g., 'g03') |
-| apply_geometry_to_plan | Apply a geometry file to a plan file. | plan_file (str), geometry_number (str), project_file (str) | None |
+| apply_geometry_to_plan | Apply a geometry file to a plan file. | plan_file (str), geometry_number (str), project_file (str), geom_entries (pandas.DataFrame, optional) | None |
 | copy_unsteady_from_template | Copy unsteady flow files from a template, find the next unsteady number, and update the project file accordingly. | project_folder (str), project_file (str), template_unsteady (str) | str: New unsteady flow number (e.g., 'u03') |
-| apply_unsteady_to_plan | Apply an unsteady flow file to a plan file. | plan_file (str), unsteady_number (str), project_file (str) | None |
+| apply_unsteady_to_plan | Apply an unsteady flow file to a plan file. | plan_file (str), unsteady_number (str), project_file (str), unsteady_entries (pandas.DataFrame, optional) | None |
 | get_project_name | Extract the project name from the given project path. | project_path (Path) | str: The project name derived from the file name without extension |
 | get_next_available_number | Determine the first available number for plan, unsteady, steady, or geometry files from 01 to 99. | existing_numbers (pandas.Series) | str: First available number as a two-digit string |
 | copy_plan_from_template | Create a new plan file based on a template and update the project file. | project_folder (str), project_name (str), template_plan (str), new_plan_shortid (str, optional) | str: New plan number |
-| run_plans_parallel | Run HEC-RAS plans in parallel using ThreadPoolExecutor. | ras_plan_entries (pd.DataFrame), hecras_exe_path (str), project_file (str), max_workers (int), cores_per_run (int) | dict: Dictionary with plan numbers as keys and execution success as values |
+| run_plans_parallel | Run HEC-RAS plans in parallel, one HEC-RAS process per test folder. | ras_plan_entries (pd.DataFrame), hecras_exe_path (str), project_file (str), max_workers (int), cores_per_run (int) | dict: Dictionary with plan numbers as keys and execution success as values |
 | set_num_cores | Update the maximum number of cores to use in the HEC-RAS plan file. | plan_file (str), num_cores (int) | None |
 | update_geompre_flags | Update the simulation plan file to modify the `Run HTab` and `UNET Use Existing IB Tables` settings. | file_path (str), run_htab_value (int), use_ib_tables_value (int) | None |
 
@@ -44,15 +61,21 @@ Session 2.2: Modifying Unsteady Flow Hydrographs
 
 | Method | Description | Arguments | Returns |
 |--------|-------------|-----------|---------|
-| extract_cross_section_attributes | Extract Cross Section Attributes from HEC-RAS HDF5 file and display as a pandas DataFrame. | hdf_path (str) | pandas.DataFrame: DataFrame containing Cross Section Attributes |
+| open_plan_hdf | Open a HEC-RAS plan HDF5 file read-only for several extract_* calls. | hdf_path (str), cache_bytes (int, optional) | h5py.File: Open file handle (as a context manager) |
+| extract_cross_section_attributes | Extract Cross Section Attributes from HEC-RAS HDF5 file and display as a pandas DataFrame. | hdf_path (str or h5py.File), fields (list, optional) | pandas.DataFrame: DataFrame containing Cross Section Attributes |
 | check_values_exist | Check if specified river, reach, and station exist in the cross_section_attributes DataFrame. | df (pandas.DataFrame), river (str), reach (str), station (str) | tuple: (river_exists, reach_exists, station_exists) |
-| extract_time_data_stamp | Extract time data stamp from HEC-RAS HDF5 file. | hdf_path (str) | pandas.DataFrame: DataFrame containing timestamps |
-| extract_water_surface_and_flow | Extract water surface and flow data for a specific station from HEC-RAS HDF5 file. | hdf_path (str), station_target (float) | pandas.DataFrame: DataFrame containing timestamps, water surface, and flow data |
+| check_values_exist_batch | Check many (river, reach, station) triples against the cross_section_attributes DataFrame. | df (pandas.DataFrame), triples (iterable) | list: (river_exists, reach_exists, station_exists) tuples |
+| clear_value_sets_cache | Forget the River/Reach/Station sets remembered by check_values_exist(_batch). | df (pandas.DataFrame, optional) | None |
+| extract_time_data_stamp | Extract time data stamp from HEC-RAS HDF5 file. | hdf_path (str or h5py.File) | pandas.DataFrame: DataFrame containing timestamps |
+| extract_water_surface_and_flow | Extract water surface and flow data for a specific station from HEC-RAS HDF5 file. | hdf_path (str or h5py.File), station_target (float), dtype (numpy.dtype, optional) | pandas.DataFrame: DataFrame containing timestamps, water surface, and flow data |
+| extract_water_surface_and_flow_multi | Extract water surface and flow data for several stations from HEC-RAS HDF5 file at once. | hdf_path (str or h5py.File), station_targets (list), dtype (numpy.dtype, optional) | dict: Dictionary of DataFrames keyed by station |
+| prebuild_station_index | Store the cross section stations as a float64 dataset next to Cross Section Attributes. | hdf_path (str) | numpy.ndarray: The station values that were stored |
 | plot_water_surface_and_flow | Plot water surface and flow data. | df_plot (pandas.DataFrame), station_name (str) | None |
 | read_unsteady_file | Read the unsteady file and return its contents as a list of lines. | file_path (str) | list: List of lines from the unsteady file |
 | identify_tables | Identify the start and end of each table in the unsteady file. | lines (list) | list: List of tuples containing table information (table_name, start_line, end_line) |
 | parse_fixed_width_table | Parse a fixed-width table into a pandas DataFrame. | lines (list), start (int), end (int) | pandas.DataFrame: DataFrame containing the parsed table data |
 | extract_tables | Extract all tables from the unsteady file and return them as a dictionary of DataFrames. | file_path (str) | dict: Dictionary of pandas DataFrames containing the extracted tables |
+| iter_tables | Stream the tables of an unsteady file as (table_name, DataFrame) pairs in one pass. | file_path (str) | generator: (table_name, pandas.DataFrame) pairs |
 | scale_flow_hydrograph | Scale the Flow Hydrograph values by a linear scale factor. | tables (dict), scale_factor (float) | tuple: (Updated tables dictionary with scaled Flow Hydrograph, Original Flow Hydrograph values) |
 | write_table_to_file | Write the updated table back to the file in fixed-width format. | file_path (str), table_name (str), df (pandas.DataFrame), start_line (int) | None |
 | plot_original_and_scaled | Plot the original and scaled Flow Hydrograph values. | original_values (pandas.Series), scaled_values (pandas.Series), scale_factor (float) | None |
@@ -63,11 +86,56 @@ Session 2.3: Applying 2D Infiltration Overrides
 |--------|-------------|-----------|---------|
 | explore_hdf | Recursively explore and print HDF5 file structure. | file_path (str), max_depth (int, optional) | None |
 | modify_infiltration_rate | Modify the infiltration rate for a specific land cover type in an HDF file. | hdf_file_path (str), land_cover_type (str), new_rate (float) | None |
+| modify_infiltration_rates | Modify the infiltration rates for several land cover types in an HDF file in one rewrite. | hdf_file_path (str), rates (dict) | None |
 | run_model | Run a HEC-RAS model for a specific plan. | project_path (str), plan_name (str) | bool: True if the model run was successful, False otherwise |
-| save_results | Save the results of a model run with a specific naming convention. | project_path (str), plan_name (str), land_cover_type (str), infiltration_rate (float) | None |
-| plot_wsel_timeseries | Plot water surface elevation time series for a specific cell ID from multiple HDF files. | hdf_paths (dict), specific_cell_id (int) | None |
+| run_models | Run a sweep of HEC-RAS model runs concurrently, each in its own copy of the project folder. | project_path (str), jobs (list), max_workers (int, optional), infiltration_hdf (str, optional) | dict: Dictionary with (land_cover_type, infiltration_rate) keys and run success as values |
+| save_results | Save the results of a model run with a specific naming convention. | project_path (str), plan_name (str), land_cover_type (str), infiltration_rate (float), link (bool, optional) | str: Path of the saved results file |
+| plot_wsel_timeseries | Plot water surface elevation time series for a specific cell ID from multiple HDF files. | hdf_paths (dict), specific_cell_id (int), mesh_name (str), max_points (int) | matplotlib.figure.Figure: The plotted figure |
 """
 
+_GEOM_FILE_RE = re.compile(rb'^Geom File=g(\d+)', re.IGNORECASE)
+_UNSTEADY_FILE_RE = re.compile(rb'^Unsteady File=u(\d+)', re.IGNORECASE)
+_HEADER_RE = re.compile(rb'^(Proj Title|Current Plan|Default Exp/Contr|English Units)', re.IGNORECASE)
+_GEOM_LINE_RE = re.compile(r'^Geom File=g.*$', re.MULTILINE)
+_FLOW_LINE_RE = re.compile(r'^Flow File=u.*$', re.MULTILINE)
+_PROJECT_ENTRY_RE = re.compile(r'^(Plan|Flow|Unsteady|Geom) File=([pfug]\d+)')
+_PLAN_FILE_RE = re.compile(r'^Plan File=p(\d+)', re.IGNORECASE)
+_SHORTID_RE = re.compile(r'^Short Identifier=(.*)$', re.IGNORECASE)
+_D2_CORES_RE = re.compile(r"(UNET D2 Cores= )\d+")
+_CORES_RE = re.compile(r"(UNET D1 Cores= |UNET D2 Cores= |PS Cores= )\d+")
+_RUN_HTAB_RE = re.compile(r"^[ \t]*Run HTab=[^\r\n]*", re.MULTILINE)
+_USE_IB_TABLES_RE = re.compile(r"^[ \t]*UNET Use Existing IB Tables=[^\r\n]*", re.MULTILINE)
+_TABLE_HEADER_RE = re.compile(r'^\s*([^=]*(?:Flow Hydrograph|Gate Openings|Stage Hydrograph|Uniform Lateral Inflow|Lateral Inflow Hydrograph))=\s*(\d+)')
+
+_CROSS_SECTIONS = '/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections'
+_CROSS_SECTION_ATTRIBUTES = f'{_CROSS_SECTIONS}/Cross Section Attributes'
+
+_PRJ_CACHE = {}
+_TIMESTAMP_CACHE = {}
+_VALUE_SETS_CACHE = {}
+
+_PLAN_TIMINGS_FILE = '.ras_plan_timings.json'
+
+# h5py's default 1 MiB chunk cache forces chunks to be re-read when slicing large
+# HEC-RAS result datasets; give every file handle a larger cache instead
+_HDF_CACHE_OPTS = {'rdcc_nbytes': 128 * 1024 * 1024, 'rdcc_nslots': 50_021, 'rdcc_w0': 0.5}
+
+# HEC-RAS executable used by run_model; reassign to point at another install
+HECRAS_EXE_PATH = r'C:\Program Files (x86)\HEC\HEC-RAS\6.6\RAS.exe'
+
+_ProjectPaths = namedtuple('_ProjectPaths', ['folder', 'project_file', 'file_prefix'])
+
+# Below this many rows per chunk, one read_direct_chunk call per chunk is slower than a hyperslab read
+_DIRECT_CHUNK_MIN_ROWS = 64
+
+# Terrain raster files that HEC-RAS only reads and this module never edits; the only files
+# _clone_project may hardlink instead of copying
+_HARDLINK_SAFE_SUFFIXES = frozenset({'.tif', '.tiff', '.vrt', '.ovr', '.flt', '.adf', '.img'})
+
+_COPY_BUFSIZE = 4 * 1024 * 1024
+_FICLONE = 0x40049409
+_COPY_FILE_NO_BUFFERING = 0x1000
+
 # Functions from Session 2.1 Command Line Automation of HEC-RAS with Python
 
 class AwsRasTools:
@@ -149,14 +217,17 @@ class AwsRasTools:
                     return None
             else:
                 print("Multiple .prj and .rasmap files found. Searching for 'Proj Title=' in .prj files.")
-                for prj_file in prj_files:
-                    with open(prj_file, 'r') as f:
-                        content = f.read()
-                        if "Proj Title=" in content:
+                project_file = None
+                with ThreadPoolExecutor(max_workers=min(8, len(prj_files))) as executor:
+                    # Read the files concurrently but keep the first match in glob order
+                    futures = [executor.submit(AwsRasTools._has_proj_title, prj_file) for prj_file in prj_files]
+                    for prj_file, future in zip(prj_files, futures):
+                        if future.result():
                             project_file = prj_file
                             print(f"Found 'Proj Title=' in file: {project_file}")
                             break
-                else:
+                    executor.shutdown(cancel_futures=True)
+                if project_file is None:
                     print("No .prj file with 'Proj Title=' found.")
                     return None
         else:
@@ -166,6 +237,87 @@ class AwsRasTools:
         print(f"Selected project file: {project_file}")
         return project_file
 
+    @staticmethod
+    def _has_proj_title(prj_file):
+        """
+        Check whether a .prj file contains a 'Proj Title=' entry.
+
+        Parameters:
+        prj_file (Path): Path to the .prj file
+
+        Returns:
+        bool: True if the file contains 'Proj Title=', False otherwise
+        """
+        with open(prj_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(b"Proj Title=") != -1
+
+    @staticmethod
+    def _parse_project_file(project_file):
+        """
+        Parse the plan, flow, unsteady and geometry entries of a project file in a single pass.
+
+        Results are cached in _PRJ_CACHE keyed on the file's path, modification time and size,
+        so repeated lookups against an unchanged project file do not re-read it. Entry numbers
+        are kept as tuples so internal membership checks can use them without building a
+        DataFrame, and so the cached values cannot be mutated by callers.
+
+        Parameters:
+        project_file (str): Full path to the HEC-RAS project file (.prj)
+
+        Returns:
+        dict: Tuples of entry numbers (e.g. '01') keyed by 'plan', 'flow', 'unsteady' and 'geom'
+        """
+        path = os.fspath(project_file)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        entries = _PRJ_CACHE.get(key)
+        if entries is None:
+            AwsRasTools.clear_project_cache(path)
+            entries = _PRJ_CACHE[key] = AwsRasTools._read_project_entries(path)
+        return entries
+
+    @staticmethod
+    def _read_project_entries(path):
+        entries = {'Plan': [], 'Flow': [], 'Unsteady': [], 'Geom': []}
+        # Stream the file through a 64 KiB buffer instead of materializing every line
+        with open(path, 'r', buffering=1 << 16) as f:
+            for line in f:
+                if line.startswith(("Plan File=", "Flow File=", "Unsteady File=", "Geom File=")):
+                    match = _PROJECT_ENTRY_RE.match(line)
+                    if match:
+                        entries[match.group(1)].append(match.group(2)[1:])
+        return {
+            'plan': tuple(entries['Plan']),
+            'flow': tuple(entries['Flow']),
+            'unsteady': tuple(entries['Unsteady']),
+            'geom': tuple(entries['Geom']),
+        }
+
+    @staticmethod
+    def clear_project_cache(project_file=None):
+        """
+        Clear cached project file parses.
+
+        Parameters:
+        project_file (str, optional): Only forget parses of this project file (all files if None)
+
+        Returns:
+        None
+
+        Example:
+        AwsRasTools.clear_project_cache()
+        """
+        if project_file is None:
+            _PRJ_CACHE.clear()
+            return
+        path = os.fspath(project_file)
+        for key in [key for key in _PRJ_CACHE if key[0] == path]:
+            del _PRJ_CACHE[key]
+
     @staticmethod
     def get_plan_entries(project_file):
         """
@@ -185,14 +337,7 @@ class AwsRasTools:
         plan_entries = AwsRasTools.get_plan_entries(project_file)
         print(plan_entries)
         """
-        plan_entries = []
-        with open(project_file, 'r') as f:
-            lines = f.readlines()
-            for line in lines:
-                if line.startswith("Plan File="):
-                    plan_number = line.split('=')[1].strip()[1:]
-                    plan_entries.append({'plan_number': plan_number})
-        return pd.DataFrame(plan_entries)
+        return pd.DataFrame({'plan_number': list(AwsRasTools._parse_project_file(project_file)['plan'])})
 
     @staticmethod
     def get_flow_entries(project_file):
@@ -213,14 +358,7 @@ class AwsRasTools:
         flow_entries = AwsRasTools.get_flow_entries(project_file)
         print(flow_entries)
         """
-        flow_entries = []
-        with open(project_file, 'r') as f:
-            lines = f.readlines()
-            for line in lines:
-                if line.startswith("Flow File="):
-                    flow_number = line.split('=')[1].strip()[1:]
-                    flow_entries.append({'flow_number': flow_number})
-        return pd.DataFrame(flow_entries)
+        return pd.DataFrame({'flow_number': list(AwsRasTools._parse_project_file(project_file)['flow'])})
 
     @staticmethod
     def get_unsteady_entries(project_file):
@@ -241,14 +379,7 @@ class AwsRasTools:
         unsteady_entries = AwsRasTools.get_unsteady_entries(project_file)
         print(unsteady_entries)
         """
-        unsteady_entries = []
-        with open(project_file, 'r') as f:
-            lines = f.readlines()
-            for line in lines:
-                if line.startswith("Unsteady File="):
-                    unsteady_number = line.split('=')[1].strip()[1:]
-                    unsteady_entries.append({'unsteady_number': unsteady_number})
-        return pd.DataFrame(unsteady_entries)
+        return pd.DataFrame({'unsteady_number': list(AwsRasTools._parse_project_file(project_file)['unsteady'])})
 
     @staticmethod
     def get_geom_entries(project_file):
@@ -269,14 +400,101 @@ class AwsRasTools:
         geom_entries = AwsRasTools.get_geom_entries(project_file)
         print(geom_entries)
         """
-        geom_entries = []
-        with open(project_file, 'r') as f:
-            lines = f.readlines()
-            for line in lines:
-                if line.startswith("Geom File="):
-                    geom_number = line.split('=')[1].strip()[1:]
-                    geom_entries.append({'geom_number': geom_number})
-        return pd.DataFrame(geom_entries)
+        return pd.DataFrame({'geom_number': list(AwsRasTools._parse_project_file(project_file)['geom'])})
+
+    @staticmethod
+    def _fast_copy(src, dst):
+        """
+        Copy a file, cloning it instead of moving bytes when the filesystem allows it.
+
+        Tries a reflink (FICLONE) and then copy_file_range on Linux, clonefile on macOS and
+        CopyFileExW on Windows. If none of these apply, falls back to shutil.copyfile on Linux
+        (which uses sendfile) or to a buffered copy with a 4 MiB buffer elsewhere.
+
+        Parameters:
+        src (str): Path of the file to copy
+        dst (str): Path of the destination file
+
+        Returns:
+        str: Path of the destination file
+        """
+        src = os.fspath(src)
+        dst = os.fspath(dst)
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"'{src}' and '{dst}' are the same file")
+
+        if sys.platform.startswith('linux'):
+            import fcntl
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    fcntl.ioctl(fdst.fileno(), getattr(fcntl, 'FICLONE', _FICLONE), fsrc.fileno())
+                return dst
+            except OSError:
+                pass
+            # Kernel-side copy; copy_file_range needs Python 3.8+ and may refuse cross-device copies
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                        remaining = os.fstat(fsrc.fileno()).st_size
+                        while remaining > 0:
+                            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                            if copied == 0:
+                                break
+                            remaining -= copied
+                    if remaining == 0:
+                        return dst
+                except OSError:
+                    pass
+            shutil.copyfile(src, dst)
+            return dst
+
+        if sys.platform == 'darwin':
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            if not os.path.lexists(dst) and libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return dst
+        elif os.name == 'nt':
+            import ctypes
+            # Unbuffered copies only pay off for large files such as geometry and results .hdf files
+            flags = _COPY_FILE_NO_BUFFERING if os.path.getsize(src) >= 128 * 1024 * 1024 else 0
+            if ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, flags):
+                return dst
+
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+        return dst
+
+    @staticmethod
+    def _scan_and_find(lines, entry_re, header_re=None):
+        """
+        Scan project file lines once for numbered entries and the insertion point for a new one.
+
+        Parameters:
+        lines (list): Lines of the project file as bytes
+        entry_re (re.Pattern): Bytes pattern whose first group is the entry number
+        header_re (re.Pattern, optional): Bytes pattern for header lines to track
+
+        Returns:
+        tuple: (lowest free entry number, index of the first entry numbered above it or None,
+                index of the last entry or None, index of the last header line or None)
+        """
+        existing_numbers = set()
+        entry_line_indices = []
+        last_header_index = None
+        for i, line in enumerate(lines):
+            match = entry_re.match(line)
+            if match:
+                number = int(match.group(1))
+                existing_numbers.add(number)
+                entry_line_indices.append((i, number))
+            elif header_re is not None and header_re.match(line):
+                last_header_index = i
+
+        next_number = AwsRasTools._lowest_free_number(existing_numbers)
+        insertion_index = next((i for i, number in entry_line_indices if number > next_number), None)
+        last_entry_index = entry_line_indices[-1][0] if entry_line_indices else None
+        return next_number, insertion_index, last_entry_index, last_header_index
 
     @staticmethod
     def copy_geometry_from_template(project_folder, project_file, template_geom):
@@ -318,72 +536,43 @@ class AwsRasTools:
         if not os.path.isfile(template_hdf_path):
             raise FileNotFoundError(f"Template geometry .hdf file '{template_hdf_path}' does not exist.")
 
-        with open(project_file, 'r') as file:
+        # Work in bytes: project files are ASCII, so decoding and re-encoding them is wasted work
+        with open(project_file, 'rb') as file:
             lines = file.readlines()
+        newline = b'\r\n' if lines and lines[0].endswith(b'\r\n') else b'\n'
 
-        geom_file_pattern = re.compile(r'^Geom File=g(\d+)', re.IGNORECASE)
-        existing_numbers = []
-
-        for line in lines:
-            match = geom_file_pattern.match(line.strip())
-            if match:
-                existing_numbers.append(int(match.group(1)))
-
-        if existing_numbers:
-            existing_numbers.sort()
-            next_number = 1
-            for num in existing_numbers:
-                if num == next_number:
-                    next_number += 1
-                else:
-                    break
-        else:
-            next_number = 1
+        next_number, insertion_index, _, last_header_index = AwsRasTools._scan_and_find(lines, _GEOM_FILE_RE, _HEADER_RE)
 
         next_geom_number = f"{next_number:02d}"
         new_geom_filename = f"{project_name}.g{next_geom_number}"
         new_geom_path = os.path.join(project_folder, new_geom_filename)
 
-        shutil.copyfile(template_geom_path, new_geom_path)
+        AwsRasTools._fast_copy(template_geom_path, new_geom_path)
         print(f"Copied '{template_geom_path}' to '{new_geom_path}'.")
 
         new_hdf_path = f"{new_geom_path}.hdf"
-        shutil.copyfile(template_hdf_path, new_hdf_path)
+        AwsRasTools._fast_copy(template_hdf_path, new_hdf_path)
         print(f"Copied '{template_hdf_path}' to '{new_hdf_path}'.")
 
-        new_geom_line = f"Geom File=g{next_geom_number}\n"
-
-        insertion_index = None
-        for i, line in enumerate(lines):
-            match = geom_file_pattern.match(line.strip())
-            if match:
-                current_number = int(match.group(1))
-                if current_number < next_number:
-                    continue
-                else:
-                    insertion_index = i
-                    break
+        new_geom_line = b"Geom File=g" + next_geom_number.encode() + newline
 
         if insertion_index is not None:
             lines.insert(insertion_index, new_geom_line)
+        elif last_header_index is not None:
+            lines.insert(last_header_index + 2, new_geom_line)
         else:
-            header_pattern = re.compile(r'^(Proj Title|Current Plan|Default Exp/Contr|English Units)', re.IGNORECASE)
-            header_indices = [i for i, line in enumerate(lines) if header_pattern.match(line.strip())]
-            if header_indices:
-                last_header_index = header_indices[-1]
-                lines.insert(last_header_index + 2, new_geom_line)
-            else:
-                lines.insert(0, new_geom_line)
+            lines.insert(0, new_geom_line)
 
-        with open(project_file, 'w') as file:
-            file.writelines(lines)
+        with open(project_file, 'wb') as file:
+            file.write(b''.join(lines))
+        AwsRasTools.clear_project_cache(project_file)
 
         print(f"Inserted 'Geom File=g{next_geom_number}' into project file '{project_file}'.")
 
         return f"g{next_geom_number}"
 
     @staticmethod
-    def apply_geometry_to_plan(plan_file, geometry_number, project_file):
+    def apply_geometry_to_plan(plan_file, geometry_number, project_file, geom_entries=None):
         """
         Apply a geometry file to a plan file.
         
@@ -394,6 +583,8 @@ class AwsRasTools:
         plan_file (str): Full path to the HEC-RAS plan file (.pXX).
         geometry_number (str): Geometry number to apply (e.g., 'g01').
         project_file (str): Full path to the project file to validate geometry number.
+        geom_entries (pandas.DataFrame, optional): Result of get_geom_entries(project_file),
+            to skip the project file lookup when applying geometries in a loop.
         
         Returns:
         None
@@ -407,21 +598,19 @@ class AwsRasTools:
         project_file = r"C:\HEC-RAS_Projects\Muncie\Muncie.prj"
         AwsRasTools.apply_geometry_to_plan(plan_file, geometry_number, project_file)
         """
-        geom_entries = AwsRasTools.get_geom_entries(project_file)
+        if geom_entries is not None:
+            geom_numbers = set(geom_entries['geom_number'])
+        else:
+            geom_numbers = AwsRasTools._parse_project_file(project_file)['geom']
         
-        if geometry_number not in geom_entries['geom_number'].values:
+        if geometry_number not in geom_numbers:
             raise ValueError(f"Geometry number {geometry_number} not found in project file.")
         
-        with open(plan_file, 'r') as f:
-            lines = f.readlines()
-        
-        with open(plan_file, 'w') as f:
-            for line in lines:
-                if line.startswith("Geom File=g"):
-                    f.write(f"Geom File=g{geometry_number}\n")
-                    print(f"Updated Geom File in {plan_file} to g{geometry_number}")
-                else:
-                    f.write(line)
+        plan_path = Path(plan_file)
+        content, replaced = _GEOM_LINE_RE.subn(f"Geom File=g{geometry_number}", plan_path.read_text(), count=1)
+        if replaced:
+            plan_path.write_text(content)
+            print(f"Updated Geom File in {plan_file} to g{geometry_number}")
 
     @staticmethod
     def copy_unsteady_from_template(project_folder, project_file, template_unsteady):
@@ -459,67 +648,47 @@ class AwsRasTools:
         if not os.path.isfile(template_unsteady_path):
             raise FileNotFoundError(f"Template unsteady flow file '{template_unsteady_path}' does not exist.")
 
-        with open(project_file, 'r') as file:
+        with open(project_file, 'rb') as file:
             lines = file.readlines()
+        newline = b'\r\n' if lines and lines[0].endswith(b'\r\n') else b'\n'
 
-        unsteady_file_pattern = re.compile(r'^Unsteady File=u(\d+)', re.IGNORECASE)
-        existing_numbers = []
-
-        for line in lines:
-            match = unsteady_file_pattern.match(line.strip())
-            if match:
-                existing_numbers.append(int(match.group(1)))
-
-        if existing_numbers:
-            next_number = max(existing_numbers) + 1
-        else:
-            next_number = 1
+        next_number, insertion_index, last_unsteady_index, _ = AwsRasTools._scan_and_find(lines, _UNSTEADY_FILE_RE)
 
         next_unsteady_number = f"{next_number:02d}"
         new_unsteady_filename = f"{project_name}.u{next_unsteady_number}"
         new_unsteady_path = os.path.join(project_folder, new_unsteady_filename)
 
-        shutil.copyfile(template_unsteady_path, new_unsteady_path)
+        AwsRasTools._fast_copy(template_unsteady_path, new_unsteady_path)
         print(f"Copied '{template_unsteady_path}' to '{new_unsteady_path}'.")
 
         template_hdf_path = f"{template_unsteady_path}.hdf"
         new_hdf_path = f"{new_unsteady_path}.hdf"
 
         if os.path.isfile(template_hdf_path):
-            shutil.copyfile(template_hdf_path, new_hdf_path)
+            AwsRasTools._fast_copy(template_hdf_path, new_hdf_path)
             print(f"Copied '{template_hdf_path}' to '{new_hdf_path}'.")
         else:
             print(f"No corresponding '.hdf' file found for '{template_unsteady_filename}'. Skipping '.hdf' copy.")
 
-        new_unsteady_line = f"Unsteady File=u{next_unsteady_number}\n"
-
-        insertion_index = None
-        for i, line in enumerate(lines):
-            match = unsteady_file_pattern.match(line.strip())
-            if match:
-                current_number = int(match.group(1))
-                if current_number > next_number:
-                    insertion_index = i
-                    break
+        new_unsteady_line = b"Unsteady File=u" + next_unsteady_number.encode() + newline
 
         if insertion_index is not None:
             lines.insert(insertion_index, new_unsteady_line)
+        elif last_unsteady_index is not None:
+            lines.insert(last_unsteady_index + 1, new_unsteady_line)
         else:
-            last_unsteady_index = max([i for i, line in enumerate(lines) if unsteady_file_pattern.match(line.strip())], default=-1)
-            if last_unsteady_index != -1:
-                lines.insert(last_unsteady_index + 1, new_unsteady_line)
-            else:
-                lines.append(new_unsteady_line)
+            lines.append(new_unsteady_line)
 
-        with open(project_file, 'w') as file:
-            file.writelines(lines)
+        with open(project_file, 'wb') as file:
+            file.write(b''.join(lines))
+        AwsRasTools.clear_project_cache(project_file)
 
         print(f"Inserted 'Unsteady File=u{next_unsteady_number}' into project file '{project_file}'.")
 
         return f"u{next_unsteady_number}"
 
     @staticmethod
-    def apply_unsteady_to_plan(plan_file, unsteady_number, project_file):
+    def apply_unsteady_to_plan(plan_file, unsteady_number, project_file, unsteady_entries=None):
         """
         Apply an unsteady flow file to a plan file.
         
@@ -530,6 +699,8 @@ class AwsRasTools:
         plan_file (str): Full path to the HEC-RAS plan file (.pXX).
         unsteady_number (str): Unsteady flow number to apply (e.g., 'u01').
         project_file (str): Full path to the project file to validate unsteady number.
+        unsteady_entries (pandas.DataFrame, optional): Result of get_unsteady_entries(project_file),
+            to skip the project file lookup when applying unsteady files in a loop.
         
         Returns:
         None
@@ -543,21 +714,19 @@ class AwsRasTools:
         project_file = r"C:\HEC-RAS_Projects\Muncie\Muncie.prj"
         AwsRasTools.apply_unsteady_to_plan(plan_file, unsteady_number, project_file)
         """
-        unsteady_entries = AwsRasTools.get_unsteady_entries(project_file)
+        if unsteady_entries is not None:
+            unsteady_numbers = set(unsteady_entries['unsteady_number'])
+        else:
+            unsteady_numbers = AwsRasTools._parse_project_file(project_file)['unsteady']
         
-        if unsteady_number not in unsteady_entries['unsteady_number'].values:
+        if unsteady_number not in unsteady_numbers:
             raise ValueError(f"Unsteady number {unsteady_number} not found in project file.")
         
-        with open(plan_file, 'r') as f:
-            lines = f.readlines()
-        
-        with open(plan_file, 'w') as f:
-            for line in lines:
-                if line.startswith("Flow File=u"):
-                    f.write(f"Flow File=u{unsteady_number}\n")
-                    print(f"Updated Flow File in {plan_file} to u{unsteady_number}")
-                else:
-                    f.write(line)
+        plan_path = Path(plan_file)
+        content, replaced = _FLOW_LINE_RE.subn(f"Flow File=u{unsteady_number}", plan_path.read_text(), count=1)
+        if replaced:
+            plan_path.write_text(content)
+            print(f"Updated Flow File in {plan_file} to u{unsteady_number}")
                     
                     
                     
@@ -588,6 +757,33 @@ class AwsRasTools:
         return Path(project_path).stem
 
 
+    @staticmethod
+    def _lowest_free_number(existing_numbers):
+        """
+        Find the lowest file number from 1 to 99 that is not already in use.
+
+        The used numbers are packed into the bits of a single integer so the lowest
+        free slot can be isolated with one bit trick instead of probing each number.
+
+        Parameters:
+        existing_numbers (iterable of int): File numbers already in use
+
+        Returns:
+        int: Lowest unused number between 1 and 99
+
+        Raises:
+        ValueError: If every number from 1 to 99 is already in use.
+        """
+        mask = 0
+        for num in existing_numbers:
+            if 0 < num < 100:
+                mask |= 1 << num
+        free = ~mask & ((1 << 100) - 2)
+        if not free:
+            raise ValueError("All file numbers from 01 to 99 are already in use.")
+        return (free & -free).bit_length() - 1
+
+
     # NOTE: REVISED IN SESSION 2.4 HOMEWORK TO HANDLE NUMBERS GREATER THAN 09
     @staticmethod
     def get_next_available_number(existing_numbers):
@@ -600,11 +796,7 @@ class AwsRasTools:
         Returns:
         str: First available number as a string
         """
-        existing_set = set(int(num[1:]) for num in existing_numbers if num[1:].isdigit())
-        
-        next_num = 1
-        while next_num in existing_set:
-            next_num += 1
+        next_num = AwsRasTools._lowest_free_number(int(num[1:]) for num in existing_numbers if num[1:].isdigit())
         
         return f"{next_num:02d}"
 
@@ -634,17 +826,24 @@ class AwsRasTools:
         if not os.path.isfile(project_file):
             raise FileNotFoundError(f"Project file not found: {project_file}")
 
-        # Read the entire project file content
-        with open(project_file, 'r') as file:
-            project_content = file.read()
+        with open(project_file, 'r') as f:
+            lines = f.readlines()
 
-        # Find all plan numbers in the project file
-        plan_numbers = re.findall(r'Plan File=p(\d+)', project_content)
-        existing_numbers = [int(num) for num in plan_numbers]
+        # Collect plan numbers, the highest one and the position of the last plan line in one pass
+        existing_numbers = []
+        max_number = 0
+        last_plan_index = None
+        for i, line in enumerate(lines):
+            match = _PLAN_FILE_RE.match(line.strip())
+            if match:
+                number = int(match.group(1))
+                existing_numbers.append(number)
+                max_number = max(max_number, number)
+                last_plan_index = i
 
         print(f"Existing plan numbers: {existing_numbers}")  # Debug print
 
-        next_number = max(existing_numbers) + 1 if existing_numbers else 1
+        next_number = max_number + 1
         new_plan_num = f"{next_number:02d}"
 
         print(f"Next plan number: {new_plan_num}")  # Debug print
@@ -658,9 +857,8 @@ class AwsRasTools:
         with open(new_plan_path, 'r') as f:
             plan_lines = f.readlines()
 
-        shortid_pattern = re.compile(r'^Short Identifier=(.*)$', re.IGNORECASE)
         for i, line in enumerate(plan_lines):
-            match = shortid_pattern.match(line.strip())
+            match = _SHORTID_RE.match(line.strip())
             if match:
                 current_shortid = match.group(1)
                 new_shortid = (new_plan_shortid or (current_shortid + "_copy"))[:24]
@@ -672,33 +870,16 @@ class AwsRasTools:
 
         print(f"Updated short identifier in {new_plan_path}")
 
-        with open(project_file, 'r') as f:
-            lines = f.readlines()
-
+        # The new number is one past the highest, so it always goes after the last plan line
         new_plan_line = f"Plan File=p{new_plan_num}\n"
-        updated_content = project_content + new_plan_line
-
-        plan_file_pattern = re.compile(r'^Plan File=p(\d+)', re.IGNORECASE)
-        insertion_index = None
-        for i, line in enumerate(lines):
-            match = plan_file_pattern.match(line.strip())
-            if match:
-                current_number = int(match.group(1))
-                if current_number > next_number:
-                    insertion_index = i
-                    break
-
-        if insertion_index is not None:
-            lines.insert(insertion_index, new_plan_line)
+        if last_plan_index is not None:
+            lines.insert(last_plan_index + 1, new_plan_line)
         else:
-            last_plan_index = max([i for i, line in enumerate(lines) if plan_file_pattern.match(line.strip())], default=-1)
-            if last_plan_index != -1:
-                lines.insert(last_plan_index + 1, new_plan_line)
-            else:
-                lines.append(new_plan_line)
+            lines.append(new_plan_line)
 
         with open(project_file, 'w') as f:
             f.writelines(lines)
+        AwsRasTools.clear_project_cache(project_file)
 
         print(f"Updated {project_file} with new plan p{new_plan_num}")
 
@@ -709,7 +890,15 @@ class AwsRasTools:
     @staticmethod
     def run_plans_parallel(ras_plan_entries, hecras_exe_path, project_file, max_workers, cores_per_run):
         """
-        Run HEC-RAS plans in parallel using ThreadPoolExecutor.
+        Run HEC-RAS plans in parallel, one HEC-RAS process per test folder.
+        
+        Each test folder runs one plan at a time; as soon as a run finishes, the next plan
+        starts in the folder it freed. HEC-RAS output for each run is written to
+        '<plan file>.log' next to the plan file instead of being held in memory.
+        
+        Plans are submitted longest-first. Run times of successful plans are recorded in
+        '.ras_plan_timings.json' in the project folder and used to order later runs; until
+        every plan has a recorded time, the size of its geometry .hdf file is used instead.
         
         Parameters:
         ras_plan_entries (pd.DataFrame): DataFrame containing plan file information
@@ -737,87 +926,305 @@ class AwsRasTools:
         print(results)
         # Expected output: {'01': True, '02': True}
         """
-        
-        def run_single_plan(plan_row, test_folder_path):
+        def start_plan(plan_row, test_folder_path):
             """
-            Execute a single HEC-RAS plan using the specified number of cores.
+            Start a single HEC-RAS plan in a test folder using the specified number of cores.
             
             Parameters:
-            plan_row (pd.Series): A row from the DataFrame containing plan details
+            plan_row (namedtuple): A row from the DataFrame containing plan details
             test_folder_path (Path): Path to the test folder where the plan will be executed
             
             Returns:
-            tuple: Plan number and execution success status
+            tuple: Running process and the open log file receiving its output
             """
-            plan_number = plan_row['plan_number']
-            file_name = plan_row['file_name']
-            full_path = plan_row['full_path']
-            
-            # Update the plan file to use the specified number of cores
-            AwsRasTools.set_num_cores(full_path, cores_per_run)
+            plan_number = plan_row.plan_number
+            file_name = plan_row.file_name
+            full_path = plan_row.full_path
             
             # Construct the new path for the plan file in the test folder
             new_full_path = test_folder_path / Path(full_path).name
+            
+            # Update the worker's copy of the plan file to use the specified number of cores
+            AwsRasTools._break_hardlink(new_full_path)
+            AwsRasTools.set_num_cores(new_full_path, cores_per_run)
+            edited_plan_files[test_folder_path].add(new_full_path)
             print(f"Executing: Plan {plan_number}, File: {file_name}, Path: {new_full_path}")
             
             # Construct the command to run the HEC-RAS executable with the plan file
             cmd = f'"{hecras_exe_path}" -c "{new_full_path}"'
             print(f"Running command: {cmd}")
+            # Send output straight to a log file instead of buffering it in memory
+            log_file = open(f"{new_full_path}.log", 'wb')
             try:
-                # Execute the command and capture the output
-                subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-                print(f"Completed: Plan {plan_number}, File: {file_name}")
-                return plan_number, True
-            except subprocess.CalledProcessError as e:
-                # Handle any errors that occur during execution
-                print(f"Failed: Plan {plan_number}, File: {file_name}")
-                print(f"Error: {e.output}")
-                return plan_number, False
+                return subprocess.Popen(cmd, shell=True, stdout=log_file, stderr=subprocess.STDOUT), log_file
+            except OSError:
+                log_file.close()
+                raise
 
-        # Create multiple copies of the project folder for parallel execution
         project_folder = Path(project_file).parent
-        test_folders = []
-        for i in range(1, max_workers + 1):
-            # Define the path for each test folder
-            test_folder_path = project_folder.parent / f"{project_folder.name} [Test {i}]"
-            # Copy the project folder to the test folder
-            shutil.copytree(project_folder, test_folder_path, dirs_exist_ok=True)
-            test_folders.append(test_folder_path)
-            print(f"Created test folder: {test_folder_path}")
 
-        results = {}
+        # Submit the longest plans first so a slow plan is not left running alone at the end
+        timings_file = project_folder / _PLAN_TIMINGS_FILE
+        plan_timings = AwsRasTools._load_plan_timings(timings_file)
+        ras_plan_entries = AwsRasTools._sort_plans_longest_first(ras_plan_entries, plan_timings)
+
+        # Create multiple copies of the project folder for parallel execution
+        test_folders = [project_folder.parent / f"{project_folder.name} [Test {i}]" for i in range(1, max_workers + 1)]
+        # Clone the project folder into each test folder concurrently; the copies are I/O-bound
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Assign each plan to a specific test folder based on its index
-            future_to_plan = {executor.submit(run_single_plan, row[1], test_folders[i % max_workers]): row[1]['plan_number'] for i, row in enumerate(ras_plan_entries.iterrows())}
-            for future in as_completed(future_to_plan):
-                # Retrieve the result of each completed future
-                plan_number, success = future.result()
+            for test_folder_path in executor.map(lambda folder: AwsRasTools._clone_project(project_folder, folder), test_folders):
+                print(f"Created test folder: {test_folder_path}")
+        # Plan files edited by set_num_cores in each folder; these are always merged back, since
+        # an in-place edit cannot be relied on to change their modification time
+        edited_plan_files = {test_folder: set() for test_folder in test_folders}
+
+        # Start the next plan in whichever test folder frees up first, so a folder
+        # never hosts two runs at once
+        results = {}
+        pending = list(ras_plan_entries.itertuples(index=False, name='PlanRow'))
+        free_folders = list(test_folders)
+        running = {}
+        while pending or running:
+            while pending and free_folders:
+                plan_row = pending.pop(0)
+                test_folder_path = free_folders.pop(0)
+                try:
+                    proc, log_file = start_plan(plan_row, test_folder_path)
+                except OSError as e:
+                    print(f"Failed: Plan {plan_row.plan_number}, File: {plan_row.file_name}")
+                    print(f"Error: {e}")
+                    results[plan_row.plan_number] = False
+                    free_folders.append(test_folder_path)
+                    continue
+                running[proc] = (plan_row, test_folder_path, log_file, time.monotonic())
+
+            finished = [proc for proc in running if proc.poll() is not None]
+            if not finished:
+                time.sleep(0.5)
+                continue
+            for proc in finished:
+                plan_row, test_folder_path, log_file, start_time = running.pop(proc)
+                log_file.close()
+                free_folders.append(test_folder_path)
+                plan_number = plan_row.plan_number
+                success = proc.returncode == 0
                 results[plan_number] = success
+                if success:
+                    print(f"Completed: Plan {plan_number}, File: {plan_row.file_name}")
+                    plan_timings[str(plan_number)] = round(time.monotonic() - start_time, 1)
+                else:
+                    print(f"Failed: Plan {plan_number}, File: {plan_row.file_name}")
+                    print(f"Error: exit code {proc.returncode}, see {log_file.name}")
 
-        # Pause 3 seconds to allow files to close
-        import time
-        time.sleep(3)
+        AwsRasTools._save_plan_timings(timings_file, plan_timings)
+
+        # HEC-RAS writes results to a .tmp.hdf and renames it when done; give any that are
+        # still being finalized up to 3 seconds instead of always pausing that long
+        for _ in range(30):
+            if not any(AwsRasTools._ras_temp_files_exist(test_folder) for test_folder in test_folders):
+                break
+            time.sleep(0.1)
 
-        # Move all test folders back to the original test folder
+        # Move all test folders back to the original test folder. The first folder holds a
+        # full copy of the project, so it is renamed (or merged) as a whole; the others only
+        # contribute files their runs wrote or changed, as their inputs are identical copies.
         final_test_folder = project_folder.parent / f"{project_folder.name} [Test]"
-        if not final_test_folder.exists():
-            final_test_folder.mkdir()
-        for test_folder in test_folders:
-            for item in test_folder.iterdir():
-                dest_path = final_test_folder / item.name
-                if dest_path.exists():
-                    # Remove existing directories or files at the destination path
-                    if dest_path.is_dir():
-                        shutil.rmtree(dest_path)
-                    else:
-                        dest_path.unlink()
-                # Move the item to the final test folder
-                shutil.move(str(item), final_test_folder)
-            # Remove the test folder after moving its contents
-            shutil.rmtree(test_folder)
+        for index, test_folder in enumerate(test_folders):
+            if index == 0 and not final_test_folder.exists():
+                os.rename(test_folder, final_test_folder)
+            else:
+                AwsRasTools._move_changed_files(test_folder, final_test_folder, project_folder if index > 0 else None,
+                                                always_move=edited_plan_files[test_folder])
+                shutil.rmtree(test_folder)
             print(f"Moved and removed test folder: {test_folder}")
 
         return results    
+
+    @staticmethod
+    def _load_plan_timings(timings_file):
+        """
+        Load recorded plan run times from a JSON sidecar file.
+
+        Parameters:
+        timings_file (Path): Path to the timings file
+
+        Returns:
+        dict: Run times in seconds keyed by plan number (empty if the file is missing or unreadable)
+        """
+        try:
+            with open(timings_file, 'r') as f:
+                plan_timings = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return plan_timings if isinstance(plan_timings, dict) else {}
+
+    @staticmethod
+    def _save_plan_timings(timings_file, plan_timings):
+        """
+        Write recorded plan run times to a JSON sidecar file.
+
+        Parameters:
+        timings_file (Path): Path to the timings file
+        plan_timings (dict): Run times in seconds keyed by plan number
+
+        Returns:
+        None
+        """
+        try:
+            with open(timings_file, 'w') as f:
+                json.dump(plan_timings, f, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"Could not save plan timings to {timings_file}: {e}")
+
+    @staticmethod
+    def _sort_plans_longest_first(ras_plan_entries, plan_timings):
+        """
+        Order plan entries by expected run time, longest first.
+
+        Recorded run times are used when every plan has one. Otherwise the size of the
+        geometry .hdf file referenced by each plan is used as a stand-in for its run time.
+
+        Parameters:
+        ras_plan_entries (pd.DataFrame): DataFrame containing plan file information
+        plan_timings (dict): Recorded run times in seconds keyed by plan number
+
+        Returns:
+        pd.DataFrame: The plan entries sorted by descending expected run time
+        """
+        plan_numbers = [str(num) for num in ras_plan_entries['plan_number']]
+        if plan_numbers and all(num in plan_timings for num in plan_numbers):
+            costs = [plan_timings[num] for num in plan_numbers]
+        else:
+            costs = []
+            for full_path in ras_plan_entries['full_path']:
+                full_path = Path(full_path)
+                try:
+                    # latin-1 decodes any byte, so plan files saved in a Windows code page still parse
+                    match = _GEOM_LINE_RE.search(full_path.read_text(encoding='latin-1'))
+                    geom_hdf = full_path.with_name(f"{full_path.stem}.{match.group(0).split('=')[1].strip()}.hdf")
+                    costs.append(os.path.getsize(geom_hdf))
+                except (OSError, AttributeError):
+                    costs.append(0)
+        order = sorted(range(len(costs)), key=lambda i: costs[i], reverse=True)
+        return ras_plan_entries.iloc[order]
+
+    @staticmethod
+    def _clone_project(src, dst):
+        """
+        Replicate a project folder for a parallel worker as cheaply as the filesystem allows.
+
+        On Linux this is `cp -a --reflink=auto`, which shares blocks copy-on-write where the
+        filesystem supports it and copies normally where it does not. Otherwise only terrain
+        raster files in subfolders (suffixes in _HARDLINK_SAFE_SUFFIXES), which neither HEC-RAS
+        nor this module ever writes, are hardlinked. Everything else, including every .hdf file
+        (land cover and infiltration layers are edited by modify_infiltration_rate(s)) and the
+        files at the top of the project folder, which HEC-RAS writes to during a run, is a real
+        copy, so a worker can never write through to the source project.
+
+        Parameters:
+        src (Path): Project folder to replicate
+        dst (Path): Destination folder; created if missing, existing files are replaced
+
+        Returns:
+        Path: The destination folder
+        """
+        src, dst = Path(src), Path(dst)
+        if sys.platform.startswith('linux') and shutil.which('cp'):
+            dst.mkdir(parents=True, exist_ok=True)
+            result = subprocess.run(['cp', '-a', '--reflink=auto', f"{src}{os.sep}.", str(dst)], capture_output=True)
+            if result.returncode == 0:
+                return dst
+
+        top_level = os.path.normcase(os.path.abspath(src))
+
+        def clone_file(src_file, dst_file):
+            if os.path.lexists(dst_file):
+                os.unlink(dst_file)
+            if (os.path.normcase(os.path.abspath(os.path.dirname(src_file))) != top_level
+                    and os.path.splitext(src_file)[1].lower() in _HARDLINK_SAFE_SUFFIXES):
+                try:
+                    os.link(src_file, dst_file)
+                    return dst_file
+                except OSError:
+                    pass
+            AwsRasTools._fast_copy(src_file, dst_file)
+            shutil.copystat(src_file, dst_file)
+            return dst_file
+
+        shutil.copytree(src, dst, copy_function=clone_file, dirs_exist_ok=True)
+        return dst
+
+    @staticmethod
+    def _ras_temp_files_exist(folder):
+        """
+        Check whether a folder still holds HEC-RAS temporary results files (*.tmp.hdf).
+
+        Parameters:
+        folder (Path): Folder to check
+
+        Returns:
+        bool: True if any temporary results file exists
+        """
+        return any(Path(folder).glob('*.tmp.hdf'))
+
+    @staticmethod
+    def _move_changed_files(src, dst, reference=None, always_move=()):
+        """
+        Move files from one folder tree into another, replacing files that already exist.
+
+        Parameters:
+        src (Path): Folder to move files from
+        dst (Path): Folder to move files into; created if missing
+        reference (Path, optional): Folder src was cloned from. Files whose size and
+            modification time still match their counterpart there are left behind, since
+            clones keep the source modification times.
+        always_move (iterable, optional): Files in src that are moved regardless of reference,
+            such as files edited in place whose modification time may not have changed
+
+        Returns:
+        None
+        """
+        src, dst = Path(src), Path(dst)
+        always_move = {Path(path) for path in always_move}
+        for folder, _, file_names in os.walk(src):
+            relative_folder = Path(folder).relative_to(src)
+            target_folder = dst / relative_folder
+            for file_name in file_names:
+                source_path = Path(folder) / file_name
+                if reference is not None and source_path not in always_move:
+                    try:
+                        original = (Path(reference) / relative_folder / file_name).stat()
+                        current = source_path.stat()
+                        if (original.st_mtime_ns, original.st_size) == (current.st_mtime_ns, current.st_size):
+                            continue
+                    except FileNotFoundError:
+                        pass
+                target_folder.mkdir(parents=True, exist_ok=True)
+                target_path = target_folder / file_name
+                try:
+                    os.replace(source_path, target_path)
+                except OSError:
+                    # Different filesystem or a directory in the way
+                    if target_path.is_dir():
+                        shutil.rmtree(target_path)
+                    shutil.move(str(source_path), str(target_path))
+
+    @staticmethod
+    def _break_hardlink(path):
+        """
+        Replace a hardlinked file with its own copy so that editing it leaves other links untouched.
+
+        Parameters:
+        path (Path): File to detach
+
+        Returns:
+        None
+        """
+        path = Path(path)
+        if path.stat().st_nlink > 1:
+            temp_path = path.with_name(path.name + '.unlink')
+            shutil.copy2(path, temp_path)
+            os.replace(temp_path, path)
     
                     
     @staticmethod
@@ -832,32 +1239,20 @@ class AwsRasTools:
         Returns:
         None
         """
-        d1_cores_pattern = re.compile(r"(UNET D1 Cores= )\d+")
-        d2_cores_pattern = re.compile(r"(UNET D2 Cores= )\d+")
-        ps_cores_pattern = re.compile(r"(PS Cores= )\d+")
-        
-        with open(plan_file, 'r') as file:
-            content = file.read()
-        
-        # First update D2 cores
-        new_content = d2_cores_pattern.sub(rf"\g<1>{num_cores}", content)
-        
-        # Check if D2 cores is 2, if so set others to 1, otherwise use num_cores
-        d2_match = d2_cores_pattern.search(new_content)
-        if d2_match and int(d2_match.group().split()[-1]) == 2:
-            new_content = d1_cores_pattern.sub(r"\g<1>1", new_content)
-            new_content = ps_cores_pattern.sub(r"\g<1>1", new_content)
+        def core_edits(content):
+            # If D2 cores is 2, set the others to 1, otherwise use num_cores
+            other_cores = 1 if num_cores == 2 and _D2_CORES_RE.search(content) else num_cores
+            replacements = {key: f"{key}{cores}" for key, cores in
+                            (('UNET D1 Cores= ', other_cores), ('UNET D2 Cores= ', num_cores), ('PS Cores= ', other_cores))}
+            return [(_CORES_RE, lambda match: replacements[match.group(1)])]
+
+        new_content = AwsRasTools._edit_file(plan_file, core_edits)
+
+        if num_cores == 2 and _D2_CORES_RE.search(new_content):
             print(f"Updated {plan_file} with 2 cores for D2 and 1 core for D1 and PS.")
         else:
-            new_content = d1_cores_pattern.sub(rf"\g<1>{num_cores}", new_content)
-            new_content = ps_cores_pattern.sub(rf"\g<1>{num_cores}", new_content)
             print(f"Updated {plan_file} with {num_cores} cores for D1, D2, and PS.")
-        
-        with open(plan_file, 'w') as file:
-            file.write(new_content)
-        
-        
-        
+
     @staticmethod
     def update_geompre_flags(file_path, run_htab_value, use_ib_tables_value):
         """
@@ -876,22 +1271,63 @@ class AwsRasTools:
         if use_ib_tables_value not in [-1, 0]:
             raise ValueError("Invalid value for `UNET Use Existing IB Tables`. Expected `0` or `-1`.")
         
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
+        AwsRasTools._edit_file(file_path, [
+            (_RUN_HTAB_RE, f"Run HTab= {run_htab_value} "),
+            (_USE_IB_TABLES_RE, f"UNET Use Existing IB Tables= {use_ib_tables_value} "),
+        ])
+
+    @staticmethod
+    def _edit_file(path, edits):
+        """
+        Apply several regex substitutions to a text file with one read and at most one write.
+
+        Substitutions that leave their match unchanged are ignored, and a file with nothing
+        to change is not written at all. When every remaining substitution keeps the text the
+        same length, which is the usual case for core counts, only the changed bytes are
+        patched in place through mmap; otherwise the file is rewritten once. The file is
+        handled as latin-1 bytes, so line endings and any non-ASCII bytes are preserved exactly.
+
+        Parameters:
+        path (str): Path to the file to edit
+        edits (list or callable): List of (compiled pattern, replacement) pairs, or a
+            callable taking the file contents and returning such a list
 
-        updated_lines = []
-        for line in lines:
-            if line.strip().startswith("Run HTab="):
-                updated_line = f"Run HTab= {run_htab_value} \n"
-                updated_lines.append(updated_line)
-            elif line.strip().startswith("UNET Use Existing IB Tables="):
-                updated_line = f"UNET Use Existing IB Tables= {use_ib_tables_value} \n"
-                updated_lines.append(updated_line)
+        Returns:
+        str: The updated file contents
+        """
+        with open(path, 'r+b') as f:
+            content = f.read().decode('latin-1')
+            if callable(edits):
+                edits = edits(content)
+
+            patches = []
+            for pattern, replacement in edits:
+                def substitute(match, replacement=replacement):
+                    text = replacement(match) if callable(replacement) else match.expand(replacement)
+                    if text != match.group(0):
+                        patches.append((match.start(), match.end(), text))
+                    return text
+                content = pattern.sub(substitute, content)
+
+            if not patches:
+                # Every setting already has the requested value; leave the file untouched
+                return content
+            patched_in_place = all(end - start == len(text) for start, end, text in patches)
+            if patched_in_place:
+                # Offsets stay valid across edits because no edit changed the length
+                with mmap.mmap(f.fileno(), 0) as mm:
+                    for start, end, text in patches:
+                        mm[start:end] = text.encode('latin-1')
+                    mm.flush()
             else:
-                updated_lines.append(line)
-        
-        with open(file_path, 'w') as file:
-            file.writelines(updated_lines)
+                f.seek(0)
+                f.write(content.encode('latin-1'))
+                f.truncate()
+        if patched_in_place:
+            # Writes through a mapped view need not update the last-write time on Windows, and the
+            # size is unchanged, so stamp the mtime for code that detects changes by (mtime, size)
+            os.utime(path)
+        return content
     
     
     
@@ -901,12 +1337,58 @@ class AwsRasTools:
 
 
     @staticmethod
-    def extract_cross_section_attributes(hdf_path):
+    @contextlib.contextmanager
+    def open_plan_hdf(hdf_path, cache_bytes=None):
+        """
+        Open a HEC-RAS plan HDF5 file read-only for several extract_* calls.
+
+        The extract_* methods accept the returned handle in place of a path, so a series of
+        queries against one plan pays for opening the file and parsing its metadata once.
+        The handle is closed when the with-block exits; it is not cached beyond that, so the
+        file is not left locked against HEC-RAS on Windows.
+
+        The file is opened with a raw-data chunk cache sized for HEC-RAS result datasets
+        (_HDF_CACHE_OPTS, 128 MiB by default) instead of HDF5's 1 MiB default, so chunks touched
+        by one column read are still cached for the next.
+
+        Parameters:
+        hdf_path (str): Path to the HEC-RAS HDF5 file
+        cache_bytes (int, optional): Chunk cache size in bytes, for reads spanning more chunks
+            than the default cache holds
+
+        Returns:
+        h5py.File: Open file handle (as a context manager)
+
+        Example:
+        with AwsRasTools.open_plan_hdf(r"Muncie_24Oct2024\Muncie.p01.hdf") as hdf:
+            df_upstream = AwsRasTools.extract_water_surface_and_flow(hdf, 15696.24)
+            df_downstream = AwsRasTools.extract_water_surface_and_flow(hdf, 237.6455)
+        """
+        cache_opts = dict(_HDF_CACHE_OPTS)
+        if cache_bytes is not None:
+            cache_opts['rdcc_nbytes'] = cache_bytes
+        with h5py.File(hdf_path, 'r', **cache_opts) as hdf:
+            yield hdf
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _as_hdf(hdf_or_path):
+        # Use an already open file as-is (and leave it open); open paths for the duration
+        if isinstance(hdf_or_path, h5py.File):
+            yield hdf_or_path
+        else:
+            with AwsRasTools.open_plan_hdf(hdf_or_path) as hdf:
+                yield hdf
+
+    @staticmethod
+    def extract_cross_section_attributes(hdf_path, fields=None):
         """
         Extract Cross Section Attributes from HEC-RAS HDF5 file and display as a pandas DataFrame.
         
         Parameters:
-        hdf_path (str): Path to the HEC-RAS HDF5 file
+        hdf_path (str or h5py.File): Path to the HEC-RAS HDF5 file, or a handle from open_plan_hdf
+        fields (list, optional): Attribute fields to read, e.g. ['River', 'Reach', 'Station'].
+            Only these fields are read from the file. Default reads all fields.
         
         Returns:
         pandas.DataFrame: DataFrame containing Cross Section Attributes
@@ -916,18 +1398,23 @@ class AwsRasTools:
         cross_section_attributes = AwsRasTools.extract_cross_section_attributes(hdf_path)
         print(cross_section_attributes)
         """
-        with h5py.File(hdf_path, 'r') as f:
-            dataset_path = '/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections/Cross Section Attributes'
-            dataset = f[dataset_path]
+        with AwsRasTools._as_hdf(hdf_path) as f:
+            dataset = f[_CROSS_SECTION_ATTRIBUTES]
             
-            data = dataset[:]
-            column_names = dataset.dtype.names
+            if fields is None:
+                data = dataset[:]
+                column_names = dataset.dtype.names
+            else:
+                column_names = [fields] if isinstance(fields, str) else list(fields)
+                data = dataset.fields(column_names)[:]
             
             df = pd.DataFrame(data, columns=column_names)
             
-            for col in df.columns:
-                if df[col].dtype == object:
-                    df[col] = df[col].str.decode('utf-8')
+            # River/reach names repeat across many rows, so decode each distinct value only once
+            for col in df.select_dtypes(['object']).columns:
+                codes, uniques = pd.factorize(df[col])
+                decoded = np.array([value.decode('utf-8') for value in uniques], dtype=object)
+                df[col] = decoded[codes]
             
             return df
 
@@ -953,11 +1440,75 @@ class AwsRasTools:
         print(f"Reach '{reach}' exists: {reach_exists}")
         print(f"Station '{station}' exists: {station_exists}")
         """
-        river_exists = river in df['River'].values
-        reach_exists = reach in df['Reach'].values
-        station_exists = station in df['Station'].astype(str).values
-        
-        return river_exists, reach_exists, station_exists
+        return AwsRasTools.check_values_exist_batch(df, [(river, reach, station)])[0]
+
+    @staticmethod
+    def check_values_exist_batch(df, triples):
+        """
+        Check many (river, reach, station) triples against the cross_section_attributes DataFrame.
+
+        Each column is turned into a set once per DataFrame and the sets are remembered while the
+        DataFrame is alive, so repeated calls (and check_values_exist) are set lookups only.
+        The remembered sets are rebuilt when the DataFrame's shape, columns or a sample of its
+        River/Reach/Station values change; after editing individual values in place, call
+        clear_value_sets_cache(df) to be certain the next check sees the edit.
+
+        Parameters:
+        df (pandas.DataFrame): DataFrame containing cross-section attributes
+        triples (iterable): (river, reach, station) tuples to check
+
+        Returns:
+        list: (river_exists, reach_exists, station_exists) tuples, in the order given
+
+        Example:
+        cross_section_attributes = AwsRasTools.extract_cross_section_attributes(hdf_path)
+        checks = AwsRasTools.check_values_exist_batch(cross_section_attributes, [("White", "Muncie", "237.6455"), ("White", "Muncie", "1000")])
+        """
+        rivers, reaches, stations = AwsRasTools._value_sets(df)
+        return [(river in rivers, reach in reaches, station in stations) for river, reach, station in triples]
+
+    @staticmethod
+    def clear_value_sets_cache(df=None):
+        """
+        Forget the River/Reach/Station sets remembered by check_values_exist(_batch).
+
+        Parameters:
+        df (pandas.DataFrame, optional): DataFrame whose sets to forget. Default forgets all.
+
+        Returns:
+        None
+
+        Example:
+        cross_section_attributes.loc[0, 'Reach'] = "Lower"
+        AwsRasTools.clear_value_sets_cache(cross_section_attributes)
+        """
+        if df is None:
+            _VALUE_SETS_CACHE.clear()
+        else:
+            _VALUE_SETS_CACHE.pop(id(df), None)
+
+    @staticmethod
+    def _value_sets_fingerprint(df):
+        # Cheap stand-in for the frame's contents: its shape and columns plus up to 64 evenly
+        # spaced rows of the searched columns, so appends, column swaps and most edits show up
+        sample = np.linspace(0, len(df) - 1, num=min(len(df), 64), dtype=np.int64)
+        rows = df[['River', 'Reach', 'Station']].iloc[sample]
+        return df.shape, tuple(df.columns), tuple(map(tuple, rows.astype(str).to_numpy()))
+
+    @staticmethod
+    def _value_sets(df):
+        # Memoize the River/Reach/Station sets by id(df); the weak reference confirms the id still
+        # belongs to the same DataFrame and drops the entry once the DataFrame is collected, and
+        # the fingerprint rebuilds the sets when the frame has been changed in place
+        key = id(df)
+        fingerprint = AwsRasTools._value_sets_fingerprint(df)
+        cached = _VALUE_SETS_CACHE.get(key)
+        if cached is not None and cached[0]() is df and cached[1] == fingerprint:
+            return cached[2]
+
+        value_sets = (set(df['River'].unique()), set(df['Reach'].unique()), set(df['Station'].astype(str).unique()))
+        _VALUE_SETS_CACHE[key] = (weakref.ref(df, lambda _, key=key: _VALUE_SETS_CACHE.pop(key, None)), fingerprint, value_sets)
+        return value_sets
 
     @staticmethod
     def extract_time_data_stamp(hdf_path):
@@ -965,7 +1516,7 @@ class AwsRasTools:
         Extract time data stamp from HEC-RAS HDF5 file.
 
         Parameters:
-        hdf_path (str): Path to the HEC-RAS HDF5 file
+        hdf_path (str or h5py.File): Path to the HEC-RAS HDF5 file, or a handle from open_plan_hdf
 
         Returns:
         pandas.DataFrame: DataFrame containing timestamps
@@ -975,25 +1526,45 @@ class AwsRasTools:
         df_timestamps = AwsRasTools.extract_time_data_stamp(hdf_path)
         print(df_timestamps.head())
         """
-        from datetime import datetime
+        # Parsed stamps are cached per file, keyed like _PRJ_CACHE, since callers
+        # typically extract many stations from the same plan results
+        path = os.path.abspath(hdf_path.filename if isinstance(hdf_path, h5py.File) else hdf_path)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        df_timestamps = _TIMESTAMP_CACHE.get(key)
+        if df_timestamps is None:
+            for stale_key in [stale_key for stale_key in _TIMESTAMP_CACHE if stale_key[0] == path]:
+                del _TIMESTAMP_CACHE[stale_key]
 
-        def parse_ras_datetime(date_string):
-            return datetime.strptime(date_string, "%d%b%Y %H:%M:%S")
+            with AwsRasTools._as_hdf(hdf_path) as hdf:
+                time_data_stamp = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Time Date Stamp'][:]
 
-        with h5py.File(hdf_path, 'r') as hdf:
-            time_data_stamp = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Time Date Stamp'][:]
+            timestamps = AwsRasTools._parse_time_stamps(time_data_stamp)
+            df_timestamps = _TIMESTAMP_CACHE[key] = pd.DataFrame({'Timestamp': timestamps})
+        return df_timestamps.copy()
 
-        timestamps = [parse_ras_datetime(ts.decode('utf-8').strip()) for ts in time_data_stamp]
-        return pd.DataFrame({'Timestamp': timestamps})
+    @staticmethod
+    def _parse_time_stamps(time_data_stamp):
+        # HEC-RAS writes midnight as "24:00:00" of the previous day, which strptime formats reject
+        stamps = np.char.strip(np.char.decode(time_data_stamp, 'utf-8'))
+        midnight = np.char.endswith(stamps, '24:00:00')
+        if midnight.any():
+            stamps = np.where(midnight, np.char.replace(stamps, '24:00:00', '00:00:00'), stamps)
+        timestamps = pd.to_datetime(stamps, format="%d%b%Y %H:%M:%S")
+        if midnight.any():
+            timestamps = timestamps + pd.to_timedelta(midnight.astype(np.int64), unit='D')
+        return timestamps
 
     @staticmethod
-    def extract_water_surface_and_flow(hdf_path, station_target):
+    def extract_water_surface_and_flow(hdf_path, station_target, dtype=None):
         """
         Extract water surface and flow data for a specific station from HEC-RAS HDF5 file.
 
         Parameters:
-        hdf_path (str): Path to the HEC-RAS HDF5 file
+        hdf_path (str or h5py.File): Path to the HEC-RAS HDF5 file, or a handle from open_plan_hdf
         station_target (float): Target station value
+        dtype (numpy.dtype, optional): Read water surface and flow as this type, e.g. np.float32
+            to halve memory for plotting. Default keeps the stored type.
 
         Returns:
         pandas.DataFrame: DataFrame containing timestamps, water surface, and flow data
@@ -1004,31 +1575,172 @@ class AwsRasTools:
         df_plot = AwsRasTools.extract_water_surface_and_flow(hdf_path, station_target)
         print(df_plot.head())
         """
-        with h5py.File(hdf_path, 'r') as hdf:
-            water_surface = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections/Water Surface'][:]
-            flow = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections/Flow'][:]
-            cross_section_attrs = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections/Cross Section Attributes'][:]
+        with AwsRasTools._as_hdf(hdf_path) as hdf:
+            matches = np.flatnonzero(AwsRasTools._station_values(hdf) == station_target)
+            if matches.size == 0:
+                raise ValueError(f"Station {station_target} not found in cross section attributes.")
+            cross_section_index = int(matches[0])
 
-        cross_section_index = None
-        for index, attr in enumerate(cross_section_attrs):
-            station_value = float(attr['Station'].decode('utf-8').strip())
-            if station_value == station_target:
-                cross_section_index = index
-                break
+            # Read only the matching cross section's column
+            water_surface = AwsRasTools._read_column(hdf[f'{_CROSS_SECTIONS}/Water Surface'], cross_section_index, dtype)
+            flow = AwsRasTools._read_column(hdf[f'{_CROSS_SECTIONS}/Flow'], cross_section_index, dtype)
 
-        if cross_section_index is None:
-            raise ValueError(f"Station {station_target} not found in cross section attributes.")
-
-        df_timestamps = AwsRasTools.extract_time_data_stamp(hdf_path)
+            df_timestamps = AwsRasTools.extract_time_data_stamp(hdf)
         
         df_plot = pd.DataFrame({
             'Timestamp': df_timestamps['Timestamp'],
-            'Water Surface': water_surface[:, cross_section_index],
-            'Flow': flow[:, cross_section_index]
+            'Water Surface': water_surface,
+            'Flow': flow
         })
 
         return df_plot
 
+    @staticmethod
+    def extract_water_surface_and_flow_multi(hdf_path, station_targets, dtype=None):
+        """
+        Extract water surface and flow data for several stations from HEC-RAS HDF5 file at once.
+
+        The stations are matched with one sorted search over the decoded station array, and the
+        water surface and flow of all matched cross sections are each read in a single selection.
+
+        Parameters:
+        hdf_path (str or h5py.File): Path to the HEC-RAS HDF5 file, or a handle from open_plan_hdf
+        station_targets (list): Target station values
+        dtype (numpy.dtype, optional): Read water surface and flow as this type, e.g. np.float32
+            to halve memory for plotting. Default keeps the stored type.
+
+        Returns:
+        dict: Dictionary of DataFrames (timestamps, water surface and flow) keyed by station
+
+        Example:
+        hdf_path = r"Muncie_24Oct2024\Muncie.p01.hdf"
+        station_dfs = AwsRasTools.extract_water_surface_and_flow_multi(hdf_path, [15696.24, 237.6455])
+        print(station_dfs[237.6455].head())
+        """
+        targets = np.asarray(station_targets, dtype=np.float64)
+        with AwsRasTools._as_hdf(hdf_path) as hdf:
+            station_values = AwsRasTools._station_values(hdf)
+            # A stable sort keeps the first cross section for repeated stations, like the single lookup
+            order = np.argsort(station_values, kind='stable')
+            sorted_stations = station_values[order]
+            positions = np.searchsorted(sorted_stations, targets)
+            # Targets above every station (or any target when there are no stations) land past the end
+            found = positions < len(sorted_stations)
+            found[found] = sorted_stations[positions[found]] == targets[found]
+            if not found.all():
+                raise ValueError(f"Stations {targets[~found].tolist()} not found in cross section attributes.")
+            indices = order[positions]
+
+            # h5py point selections need increasing, unique column indices
+            columns, column_of_target = np.unique(indices, return_inverse=True)
+            water_surface_dataset = hdf[f'{_CROSS_SECTIONS}/Water Surface']
+            flow_dataset = hdf[f'{_CROSS_SECTIONS}/Flow']
+            if dtype is not None:
+                water_surface_dataset = water_surface_dataset.astype(dtype)
+                flow_dataset = flow_dataset.astype(dtype)
+            water_surface = water_surface_dataset[:, columns]
+            flow = flow_dataset[:, columns]
+
+            df_timestamps = AwsRasTools.extract_time_data_stamp(hdf)
+
+        return {
+            station: pd.DataFrame({
+                'Timestamp': df_timestamps['Timestamp'],
+                'Water Surface': water_surface[:, column],
+                'Flow': flow[:, column]
+            })
+            for station, column in zip(station_targets, column_of_target)
+        }
+
+    @staticmethod
+    def prebuild_station_index(hdf_path):
+        """
+        Store the cross section stations as a float64 dataset next to Cross Section Attributes.
+
+        The station lookups in extract_water_surface_and_flow and
+        extract_water_surface_and_flow_multi read this dataset when it is present instead of
+        decoding the byte-string Station field each time. HEC-RAS drops it when it rewrites the
+        results file on the next run.
+
+        Parameters:
+        hdf_path (str): Path to the HEC-RAS HDF5 file
+
+        Returns:
+        numpy.ndarray: The station values that were stored
+
+        Example:
+        AwsRasTools.prebuild_station_index(r"Muncie_24Oct2024\Muncie.p01.hdf")
+        """
+        with h5py.File(hdf_path, 'r+', **_HDF_CACHE_OPTS) as hdf:
+            attributes = hdf[_CROSS_SECTION_ATTRIBUTES]
+            station_values = AwsRasTools._decode_stations(attributes.fields('Station')[:])
+            index_path = _CROSS_SECTION_ATTRIBUTES + '_StationF64'
+            if index_path in hdf:
+                del hdf[index_path]
+            hdf.create_dataset(index_path, data=station_values)
+        print(f"Stored {len(station_values)} station values in {index_path}")
+        return station_values
+
+    @staticmethod
+    def _station_values(hdf):
+        # Use the prebuilt float station dataset if it is present and matches the attributes
+        attributes = hdf[_CROSS_SECTION_ATTRIBUTES]
+        index = hdf.get(_CROSS_SECTION_ATTRIBUTES + '_StationF64')
+        if index is not None and index.shape == attributes.shape:
+            return index[:]
+        return AwsRasTools._decode_stations(attributes.fields('Station')[:])
+
+    @staticmethod
+    def _decode_stations(stations):
+        # Decode byte-string stations to floats; interpolated cross sections carry a trailing '*'
+        return np.char.strip(np.char.decode(stations, 'utf-8'), ' *').astype(np.float64)
+
+    @staticmethod
+    def _read_column(dataset, index, dtype=None):
+        # Hyperslab-read one column of a (time, location) dataset straight into its output array,
+        # in the stored type unless dtype asks HDF5 to convert during the read
+        out = np.empty(dataset.shape[0], dtype=dataset.dtype if dtype is None else dtype)
+        if not AwsRasTools._read_column_chunks(dataset, index, out):
+            dataset.read_direct(out, source_sel=np.s_[:, index])
+        return out
+
+    @staticmethod
+    def _read_column_chunks(dataset, index, out):
+        """
+        Fill out with one column of an unfiltered chunked 2D dataset using direct chunk reads.
+
+        The offsets of the chunks holding the column follow from the chunk shape, so every chunk
+        is fetched straight from the chunk index with read_direct_chunk, bypassing the filter
+        pipeline and hyperslab machinery. Each chunk costs a Python-level call, so this only pays
+        off for chunks spanning at least _DIRECT_CHUNK_MIN_ROWS time steps; row-chunked layouts
+        such as (1, n) or (10, n) are left to the hyperslab read.
+
+        Parameters:
+        dataset (h5py.Dataset): 2D (time, location) dataset
+        index (int): Column to read
+        out (numpy.ndarray): Output array of length dataset.shape[0]
+
+        Returns:
+        bool: False if the dataset is filtered, unchunked, chunked in short row blocks or has
+            unwritten chunks, leaving out unfilled
+        """
+        chunks = dataset.chunks
+        if (chunks is None or len(chunks) != 2 or chunks[0] < _DIRECT_CHUNK_MIN_ROWS
+                or dataset.id.get_create_plist().get_nfilters()
+                or not dataset.dtype.isnative or not hasattr(dataset.id, 'read_direct_chunk')):
+            return False
+        rows, cols = chunks
+        col_start = index - index % cols
+        try:
+            for row_start in range(0, dataset.shape[0], rows):
+                _, raw = dataset.id.read_direct_chunk((row_start, col_start))
+                block = np.frombuffer(raw, dtype=dataset.dtype).reshape(rows, cols)
+                row_stop = min(row_start + rows, dataset.shape[0])
+                out[row_start:row_stop] = block[:row_stop - row_start, index - col_start]
+        except (OSError, KeyError, ValueError, RuntimeError):
+            return False
+        return True
+
     @staticmethod
     def plot_water_surface_and_flow(df_plot, station_name):
         """
@@ -1098,21 +1810,46 @@ class AwsRasTools:
         lines = AwsRasTools.read_unsteady_file(unsteady_file_path)
         tables = AwsRasTools.identify_tables(lines)
         """
-        table_types = ['Flow Hydrograph=', 'Gate Openings=', 'Stage Hydrograph=', 
-                       'Uniform Lateral Inflow=', 'Lateral Inflow Hydrograph=']
         tables = []
         current_table = None
         for i, line in enumerate(lines):
-            if any(table_type in line for table_type in table_types):
+            match = _TABLE_HEADER_RE.match(line)
+            if match:
                 if current_table:
                     tables.append((current_table[0], current_table[1], i-1))
-                table_name = line.strip().split('=')[0] + '='
-                num_values = int(line.strip().split('=')[1])
-                current_table = (table_name, i+1, num_values)
+                current_table = (match.group(1) + '=', i+1, int(match.group(2)))
         if current_table:
             tables.append((current_table[0], current_table[1], current_table[1] + (current_table[2] + 9) // 10))
         return tables
 
+    @staticmethod
+    def _parse_fixed_width_numeric(lines, width):
+        """
+        Parse fixed-width numeric lines into a flat float array in one vectorized pass.
+
+        Parameters:
+        lines (list): Lines of the table, with or without trailing newlines
+        width (int): Width of every field in characters
+
+        Returns:
+        numpy.ndarray: Values in row-major order, blank and non-numeric fields dropped
+        """
+        rows = [line.rstrip('\r\n') for line in lines]
+        if not rows:
+            return np.empty(0, dtype=np.float64)
+        row_width = -(-max(len(row) for row in rows) // width) * width
+        if row_width == 0:
+            return np.empty(0, dtype=np.float64)
+        buffer = ''.join(row.ljust(row_width) for row in rows).encode('ascii', 'replace')
+        fields = np.char.strip(np.frombuffer(buffer, dtype=f'S{width}'))
+        fields = fields[fields != b'']
+        try:
+            return fields.astype(np.float64)
+        except ValueError:
+            # Skip non-numeric fields rather than failing the whole table
+            values = pd.to_numeric(pd.Series(np.char.decode(fields, 'ascii')), errors='coerce')
+            return values.dropna().to_numpy(dtype=np.float64)
+
     @staticmethod
     def parse_fixed_width_table(lines, start, end):
         """
@@ -1131,19 +1868,7 @@ class AwsRasTools:
         tables = AwsRasTools.identify_tables(lines)
         df = AwsRasTools.parse_fixed_width_table(lines, tables[0][1], tables[0][2])
         """
-        data = []
-        for line in lines[start:end]:
-            values = [line[i:i+8].strip() for i in range(0, len(line), 8)]
-            parsed_values = []
-            for value in values:
-                try:
-                    if len(value) > 8:
-                        parsed_values.extend([float(value[:8]), float(value[8:])])
-                    elif value:
-                        parsed_values.append(float(value))
-                except ValueError:
-                    continue
-            data.extend(parsed_values)
+        data = AwsRasTools._parse_fixed_width_numeric(lines[start:end], 8)
         return pd.DataFrame(data, columns=['Value'])
 
     @staticmethod
@@ -1164,13 +1889,50 @@ class AwsRasTools:
             print(f"\n{table_name}")
             print(df)
         """
-        lines = AwsRasTools.read_unsteady_file(file_path)
-        tables = AwsRasTools.identify_tables(lines)
-        extracted_tables = {}
-        for table_name, start, end in tables:
-            df = AwsRasTools.parse_fixed_width_table(lines, start, end)
-            extracted_tables[table_name] = df
-        return extracted_tables
+        return dict(AwsRasTools.iter_tables(file_path))
+
+    @staticmethod
+    def iter_tables(file_path):
+        """
+        Stream the tables of an unsteady file as (table_name, DataFrame) pairs in one pass.
+
+        Each table is read for exactly the number of values its header declares, 10 per line,
+        so only the current table's lines are held in memory.
+
+        Parameters:
+        file_path (str): Path to the unsteady file
+
+        Returns:
+        generator: (table_name, pandas.DataFrame) pairs in file order
+
+        Example:
+        for table_name, df in AwsRasTools.iter_tables(unsteady_file_path):
+            print(table_name, len(df))
+        """
+        table_name = None
+        num_values = 0
+        table_lines = []
+        with open(file_path, 'r', buffering=1 << 16) as file:
+            for line in file:
+                if table_name is not None and len(table_lines) < (num_values + 9) // 10:
+                    table_lines.append(line)
+                    continue
+                if table_name is not None:
+                    yield table_name, AwsRasTools._table_frame(table_lines, num_values)
+                    table_name = None
+                match = _TABLE_HEADER_RE.match(line)
+                if match:
+                    table_name = match.group(1) + '='
+                    num_values = int(match.group(2))
+                    table_lines = []
+        if table_name is not None:
+            yield table_name, AwsRasTools._table_frame(table_lines, num_values)
+
+    @staticmethod
+    def _table_frame(table_lines, num_values):
+        # Parse a table's lines at once and keep only the values its header declares
+        values = AwsRasTools._parse_fixed_width_numeric(table_lines, 8)[:num_values]
+        return pd.DataFrame(values, columns=['Value'])
 
     @staticmethod
     def scale_flow_hydrograph(tables, scale_factor):
@@ -1195,8 +1957,9 @@ class AwsRasTools:
         
         flow_df = tables["Flow Hydrograph="]
         original_values = flow_df['Value'].copy()
-        flow_df['Value'] = (flow_df['Value'] * scale_factor).round().astype(int)
-        tables["Flow Hydrograph="] = flow_df
+        # np.rint rounds half to even, the same as Series.round()
+        scaled = np.rint(flow_df['Value'].to_numpy(dtype=np.float64) * scale_factor).astype(np.int64)
+        tables["Flow Hydrograph="] = pd.DataFrame({'Value': scaled}, index=flow_df.index)
         
         return tables, original_values
 
@@ -1217,19 +1980,18 @@ class AwsRasTools:
         Example:
         AwsRasTools.write_table_to_file(unsteady_file_path, "Flow Hydrograph=", tables["Flow Hydrograph="], start_line)
         """
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
-        
-        formatted_values = []
-        for i in range(0, len(df), 10):
-            row = df['Value'].iloc[i:i+10]
-            formatted_row = ''.join(f'{value:8d}' for value in row)
-            formatted_values.append(formatted_row + '\n')
-        
-        lines[start_line:start_line+len(formatted_values)] = formatted_values
-        
-        with open(file_path, 'w') as file:
-            file.writelines(lines)
+        values = np.rint(df['Value'].to_numpy(dtype=np.float64)).astype(np.int64)
+        formatted = np.char.mod('%8d', values).tolist()
+
+        with open(file_path, 'r+b') as file:
+            lines = file.read().splitlines(keepends=True)
+            newline = '\r\n' if lines and lines[0].endswith(b'\r\n') else '\n'
+            block = ''.join(''.join(formatted[i:i+10]) + newline for i in range(0, len(formatted), 10)).encode('ascii')
+
+            # Lines before the table are left untouched; rewrite from the table onwards
+            file.seek(sum(len(line) for line in lines[:start_line]))
+            file.write(block + b''.join(lines[start_line + (len(formatted) + 9) // 10:]))
+            file.truncate()
 
     @staticmethod
     def plot_original_and_scaled(original_values, scaled_values, scale_factor):
@@ -1284,6 +2046,17 @@ class AwsRasTools:
         Returns:
         None
         """
+        def print_chunk_summary(dsid):
+            # chunk_iter walks the chunk index once; get_chunk_info(i) restarts
+            # the walk for every chunk and takes hours on million-chunk datasets.
+            if hasattr(dsid, 'chunk_iter'):
+                chunks = []
+                dsid.chunk_iter(lambda info: chunks.append(info))
+                print(f"Stored chunks: {len(chunks)} ({sum(info.size for info in chunks)} bytes)")
+            else:
+                print(f"Stored chunks: {dsid.get_num_chunks()}")
+                print("  Warning: h5py/HDF5 too old for chunk_iter; skipping per-chunk details")
+
         def print_hdf_structure(name, obj):
             print(f"\nPath: {name}")
             print(f"Type: {type(obj).__name__}")
@@ -1291,6 +2064,9 @@ class AwsRasTools:
             if isinstance(obj, h5py.Dataset):
                 print(f"Shape: {obj.shape}")
                 print(f"Dtype: {obj.dtype}")
+                if obj.chunks is not None:
+                    print(f"Chunks: {obj.chunks}")
+                    print_chunk_summary(obj.id)
                 print("Attributes:")
                 for key, value in obj.attrs.items():
                     print(f"  {key}: {value}")
@@ -1306,7 +2082,7 @@ class AwsRasTools:
                     _recursive_explore(f"{name}/{key}", value, current_depth + 1)
 
         try:
-            with h5py.File(file_path, 'r') as hdf_file:
+            with h5py.File(file_path, 'r', **_HDF_CACHE_OPTS) as hdf_file:
                 hdf_file.visititems(lambda name, obj: _recursive_explore(name, obj))
         except Exception as e:
             print(f"Error exploring HDF file: {e}")
@@ -1324,64 +2100,81 @@ class AwsRasTools:
         Returns:
         None
         """
-        print(f"Starting modification of infiltration rate for {land_cover_type} to {new_rate}")
-        with h5py.File(hdf_file_path, 'r+') as hdf_file:
+        AwsRasTools.modify_infiltration_rates(hdf_file_path, {land_cover_type: new_rate})
+
+    @staticmethod
+    def modify_infiltration_rates(hdf_file_path, rates):
+        """
+        Modify the infiltration rates for several land cover types in an HDF file in one rewrite.
+
+        Parameters:
+        hdf_file_path (str): Path to the HDF file
+        rates (dict): New infiltration rate values keyed by land cover type. A name matching
+            several land cover types gets the rate of the last one listed.
+
+        Returns:
+        None
+
+        Example:
+        AwsRasTools.modify_infiltration_rates(hdf_file_path, {"Forest": 0.1, "Pasture": 0.3})
+        """
+        for land_cover_type, new_rate in rates.items():
+            print(f"Starting modification of infiltration rate for {land_cover_type} to {new_rate}")
+        # Edit a private copy if the file is hardlinked, e.g. into a worker clone of a project
+        AwsRasTools._break_hardlink(hdf_file_path)
+        with h5py.File(hdf_file_path, 'r+', **_HDF_CACHE_OPTS) as hdf_file:
             print(f"Opened HDF file: {hdf_file_path}")
             dataset = hdf_file['/Variables']
             print("Accessed '/Variables' dataset")
             
-            original_chunks = dataset.chunks
-            original_compression = dataset.compression
-            original_compression_opts = dataset.compression_opts
-            original_maxshape = dataset.maxshape
-            print(f"Stored original dataset properties: chunks={original_chunks}, compression={original_compression}")
-            
-            names = [name.decode('utf-8') for name in dataset['Name'][:]]
+            # Update the rate field in place rather than deleting and recreating the dataset,
+            # which rewrote every chunk and left the freed space behind in the file
+            names = np.char.decode(dataset.fields('Name')[:], 'utf-8')
             print(f"Converted dataset names to list of strings. Total names: {len(names)}")
+            rates_column = dataset.fields('Minimum Infiltration Rate')[:]
+            changed = np.zeros(len(names), dtype=bool)
+            masks = {}
             
-            mask = np.array([land_cover_type in name for name in names])
-            print(f"Created boolean mask. Matching entries: {np.sum(mask)}")
-            
-            new_data = dataset[:]
+            for land_cover_type, new_rate in rates.items():
+                mask = masks[land_cover_type] = np.char.find(names, land_cover_type) >= 0
+                print(f"Created boolean mask for {land_cover_type}. Matching entries: {np.sum(mask)}")
+                rates_column[mask] = new_rate
+                changed |= mask
+                print(f"Modified infiltration rate for {np.sum(mask)} entries")
             
-            new_data['Minimum Infiltration Rate'][mask] = new_rate
-            print(f"Modified infiltration rate for {np.sum(mask)} entries")
-            
-            del hdf_file['/Variables']
-            print("Deleted original '/Variables' dataset")
-            
-            hdf_file.create_dataset('/Variables', data=new_data, 
-                                    chunks=original_chunks,
-                                    compression=original_compression,
-                                    compression_opts=original_compression_opts,
-                                    maxshape=original_maxshape)
-            print("Created new '/Variables' dataset with modified data")
+            # Write back only the chunks that hold a modified entry
+            for chunk_slice in (dataset.iter_chunks() if dataset.chunks else [(slice(None),)]):
+                if changed[chunk_slice].any():
+                    dataset[chunk_slice + ('Minimum Infiltration Rate',)] = rates_column[chunk_slice]
+            print("Wrote modified rates to the '/Variables' dataset in place")
             
         print("Verifying changes...")
-        with h5py.File(hdf_file_path, 'r') as hdf_file:
-            verify_dataset = hdf_file['/Variables']
-            verify_names = [name.decode('utf-8') for name in verify_dataset['Name'][:]]
-            verify_mask = np.array([land_cover_type in name for name in verify_names])
+        with h5py.File(hdf_file_path, 'r', **_HDF_CACHE_OPTS) as hdf_file:
+            # Names are untouched by the update, so only the rate field is re-read and the
+            # decoded names and masks from above are reused
+            verify_rates = hdf_file['/Variables'].fields('Minimum Infiltration Rate')[:]
             
-            modified_rates = verify_dataset['Minimum Infiltration Rate'][verify_mask]
-            modified_names = np.array(verify_names)[verify_mask]
+            # rates_column already holds the rate each entry should now have
+            for land_cover_type, verify_mask in masks.items():
+                print(f"Modified entries for {land_cover_type}:")
+                if verify_mask.any():
+                    print("\n".join(f"{name}: {rate}" for name, rate in zip(names[verify_mask], verify_rates[verify_mask])))
             
-            print(f"Modified entries for {land_cover_type}:")
-            for name, rate in zip(modified_names, modified_rates):
-                print(f"{name}: {rate}")
-            
-            if np.all(modified_rates == new_rate):
-                print(f"Verification successful. All matching entries have been updated to {new_rate}")
+            if np.array_equal(verify_rates[changed], rates_column[changed]):
+                print("Verification successful. All matching entries have been updated.")
             else:
                 print("Verification failed. Not all entries were updated correctly.")
         
-        print(f"Successfully modified {land_cover_type} infiltration rate to {new_rate}")
+        for land_cover_type, new_rate in rates.items():
+            print(f"Successfully modified {land_cover_type} infiltration rate to {new_rate}")
 
     @staticmethod
     def run_model(project_path, plan_name):
         """
         Run a HEC-RAS model for a specific plan.
 
+        The executable is taken from the module-level HECRAS_EXE_PATH.
+
         Parameters:
         project_path (str): Path to the project folder
         plan_name (str): Name of the plan file (without extension)
@@ -1389,12 +2182,8 @@ class AwsRasTools:
         Returns:
         bool: True if the model run was successful, False otherwise
         """
-        hecras_exe_path = r'C:\Program Files (x86)\HEC\HEC-RAS\6.6\RAS.exe'
-
-        abs_project_path = os.path.abspath(project_path)
-        project_file = os.path.join(abs_project_path, "BaldEagleDamBrk.prj")
-        plan_file = os.path.join(abs_project_path, f"BaldEagleDamBrk.{plan_name}")
-        success = AwsRasTools.compute_hecras_plan(hecras_exe_path, project_file, plan_file)
+        paths = AwsRasTools._project_paths(os.path.abspath(project_path))
+        success = AwsRasTools.compute_hecras_plan(HECRAS_EXE_PATH, paths.project_file, f"{paths.file_prefix}.{plan_name}")
         if success:
             print(f"Completed model run for {plan_name}")
         else:
@@ -1402,185 +2191,261 @@ class AwsRasTools:
         return success
 
     @staticmethod
-    def save_results(project_path, plan_name, land_cover_type, infiltration_rate):
+    def run_models(project_path, jobs, max_workers=None, infiltration_hdf=None):
         """
-        Save the results of a model run with a specific naming convention.
+        Run a sweep of HEC-RAS model runs concurrently, each in its own copy of the project folder.
+
+        Every job gets a fresh clone of the project (see _clone_project), so the runs never share
+        HEC-RAS temporary or lock files. If infiltration_hdf is given, the job's rate is written
+        to that file in the clone before the run. Successful results are saved with save_results
+        and moved back into project_path, and the clone is removed. A job whose inputs are missing
+        or unreadable is reported and counted as failed; the other jobs still run.
 
         Parameters:
         project_path (str): Path to the project folder
-        plan_name (str): Name of the plan file (without extension)
-        land_cover_type (str): Type of land cover modified
-        infiltration_rate (float): Infiltration rate used
+        jobs (list): (plan_name, land_cover_type, infiltration_rate) tuples
+        max_workers (int, optional): Number of concurrent runs. Default is half the CPU count.
+        infiltration_hdf (str, optional): Infiltration HDF file, relative to the project folder
 
         Returns:
-        None
-        """
-        source = os.path.join(project_path, f"BaldEagleDamBrk.{plan_name}.hdf")
-        destination = os.path.join(project_path, f"BaldEagleDamBrk_{land_cover_type}_{infiltration_rate:.2f}.{plan_name}.hdf")
-        shutil.copy(source, destination)
-        print(f"Saved results to {destination}")
+        dict: Dictionary with (land_cover_type, infiltration_rate) keys and run success as values
 
-    @staticmethod
-    def plot_wsel_timeseries(hdf_paths, specific_cell_id=767):
-        """
-        Plots the water surface elevation time series for a specific cell ID from multiple HDF files with different infiltration rates.
-
-        Parameters:
-        hdf_paths (dict): Dictionary containing infiltration rates as keys and corresponding HDF file paths as values.
-        specific_cell_id (int): The specific cell ID to plot the time series for. Default is 767.
-
-        Returns:
-        None
+        Example:
+        jobs = [("p01", "Forest", rate) for rate in (0.1, 0.2, 0.3)]
+        results = AwsRasTools.run_models("BaldEagleDamBrk", jobs, max_workers=3, infiltration_hdf="Infiltration.hdf")
         """
-        timeseries_data = {}
+        project_folder = Path(project_path).resolve()
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
 
-        for rate, path in hdf_paths.items():
-            cells_timeseries_ds = HdfResultsMesh.mesh_cells_timeseries_output(path)
-            timeseries_data[rate] = cells_timeseries_ds['BaldEagleCr']['Water Surface']
-
-        plt.figure(figsize=(12, 6))
+        def run_job(job_index, job):
+            plan_name, land_cover_type, infiltration_rate = job
+            job_folder = project_folder.parent / f"{project_folder.name} [Run {job_index}]"
+            try:
+                AwsRasTools._clone_project(project_folder, job_folder)
+                if infiltration_hdf is not None:
+                    AwsRasTools.modify_infiltration_rate(str(job_folder / infiltration_hdf), land_cover_type, infiltration_rate)
+                success = AwsRasTools.run_model(str(job_folder), plan_name)
+                if success:
+                    saved = AwsRasTools.save_results(str(job_folder), plan_name, land_cover_type, infiltration_rate, link=True)
+                    os.replace(saved, project_folder / os.path.basename(saved))
+                    print(f"Moved results to {project_folder / os.path.basename(saved)}")
+                return success
+            except (OSError, KeyError, ValueError) as e:
+                # A missing or unreadable input fails this job only, not the rest of the sweep
+                print(f"Failed: {land_cover_type} at rate {infiltration_rate}, plan {plan_name}")
+                print(f"Error: {e}")
+                return False
+            finally:
+                shutil.rmtree(job_folder, ignore_errors=True)
 
-        for rate, water_surface in timeseries_data.items():
-            time_values = water_surface.coords['time'].values
-            wsel_timeseries = water_surface.sel(cell_id=specific_cell_id)
-            peak_value = wsel_timeseries.max().item()
-            peak_index = wsel_timeseries.argmax().item()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(run_job, range(1, len(jobs) + 1), jobs)
+            return {(job[1], job[2]): success for job, success in zip(jobs, outcomes)}
 
-            plt.plot(time_values, wsel_timeseries, label=f'Cell ID: {specific_cell_id}, Rate: {rate}')
-            plt.scatter(time_values[peak_index], peak_value, s=100, zorder=5, label=f'Peak at Rate: {rate}')
-            plt.annotate(f'Peak: {peak_value:.2f} ft', 
-                        (time_values[peak_index], peak_value),
-                        xytext=(10, 10), textcoords='offset points',
-                        ha='left', va='bottom',
-                        bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
-                        arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
+    @staticmethod
+    def save_results(project_path, plan_name, land_cover_type, infiltration_rate, link=False):
+        """
+        Save the results of a model run with a specific naming convention.
 
-        plt.title(f'Water Surface Elevation Time Series for Specific Cell (ID: {specific_cell_id})')
-        plt.xlabel('Time')
-        plt.ylabel('Water Surface Elevation (ft)')
-        plt.legend()
-        plt.grid(True)
-        plt.tight_layout()
+        The results are cloned with _fast_copy (a copy-on-write reflink where the filesystem
+        supports it), so the saved file is unaffected when the next run rewrites the plan HDF.
+        With link=True the saved file is a hardlink instead, which costs nothing but shares its
+        data with the plan HDF; use it only when that file will not be run again, e.g. in a
+        throwaway clone of the project.
 
-        logging.info(f"Plotted water surface elevation time series for specific cell ID: {specific_cell_id} for all infiltration rates")
+        Parameters:
+        project_path (str): Path to the project folder
+        plan_name (str): Name of the plan file (without extension)
+        land_cover_type (str): Type of land cover modified
+        infiltration_rate (float): Infiltration rate used
+        link (bool, optional): Hardlink instead of copying when possible. Default is False.
 
-        plt.show()
+        Returns:
+        str: Path of the saved results file
+        """
+        paths = AwsRasTools._project_paths(os.path.abspath(project_path))
+        source = f"{paths.file_prefix}.{plan_name}.hdf"
+        destination = f"{paths.file_prefix}_{land_cover_type}_{infiltration_rate:.2f}.{plan_name}.hdf"
+        if os.path.lexists(destination):
+            os.unlink(destination)
+        linked = False
+        if link:
+            try:
+                os.link(source, destination)
+                linked = True
+            except OSError:
+                pass
+        if not linked:
+            AwsRasTools._fast_copy(source, destination)
+            shutil.copystat(source, destination)
+        print(f"Saved results to {destination}")
+        return destination
 
-        for rate, water_surface in timeseries_data.items():
-            wsel_timeseries = water_surface.sel(cell_id=specific_cell_id)
-            peak_value = wsel_timeseries.max().item()
-            peak_index = wsel_timeseries.argmax().item()
-            print(f"Statistics for Cell ID {specific_cell_id} at Infiltration Rate {rate}:")
-            print(f"Minimum WSEL: {wsel_timeseries.min().item():.2f} ft")
-            print(f"Maximum WSEL: {peak_value:.2f} ft")
-            print(f"Mean WSEL: {wsel_timeseries.mean().item():.2f} ft")
-            print(f"Time of peak: {time_values[peak_index]}")          
-                      
-            
     @staticmethod
-    def extract_cross_section_attributes(hdf_path):
+    @functools.lru_cache(maxsize=256)
+    def _project_paths(abs_project_path):
         """
-        Extract Cross Section Attributes from HEC-RAS HDF5 file and display as a pandas DataFrame.
-        
+        Build the BaldEagleDamBrk file paths used by run_model and save_results, once per folder.
+
         Parameters:
-        hdf_path (str): Path to the HEC-RAS HDF5 file
-        
+        abs_project_path (str): Absolute path to the project folder
+
         Returns:
-        pandas.DataFrame: DataFrame containing Cross Section Attributes
+        _ProjectPaths: (folder, project_file, file_prefix); plan and result files are
+            file_prefix followed by their suffix
         """
-        with h5py.File(hdf_path, 'r') as f:
-            dataset_path = '/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections/Cross Section Attributes'
-            dataset = f[dataset_path]
-            
-            data = dataset[:]
-            column_names = dataset.dtype.names
-            
-            df = pd.DataFrame(data, columns=column_names)
-            
-            for col in df.columns:
-                if df[col].dtype == object:
-                    df[col] = df[col].str.decode('utf-8')
-            
-            return df
+        file_prefix = os.path.join(abs_project_path, "BaldEagleDamBrk")
+        return _ProjectPaths(abs_project_path, f"{file_prefix}.prj", file_prefix)
 
     @staticmethod
-    def check_values_exist(df, river, reach, station):
+    def _read_cell(hdf_path, cell_id, mesh_name):
         """
-        Check if specified river, reach, and station exist in the cross_section_attributes DataFrame.
+        Read one mesh cell's water surface time series from a plan HDF file.
 
         Parameters:
-        df (pandas.DataFrame): DataFrame containing cross-section attributes
-        river (str): River name to check
-        reach (str): Reach name to check
-        station (str): Station value to check
+        hdf_path (str): Path to the HEC-RAS plan HDF file
+        cell_id (int): Cell index within the 2D flow area
+        mesh_name (str): Name of the 2D flow area
 
         Returns:
-        tuple: (river_exists, reach_exists, station_exists)
+        pandas.Series: Water surface elevations indexed by timestamp
         """
-        river_exists = river in df['River'].values
-        reach_exists = reach in df['Reach'].values
-        station_exists = station in df['Station'].astype(str).values
-        
-        return river_exists, reach_exists, station_exists
+        base = '/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series'
+        with h5py.File(hdf_path, 'r', **_HDF_CACHE_OPTS) as hdf:
+            water_surface = AwsRasTools._read_column(hdf[f'{base}/2D Flow Areas/{mesh_name}/Water Surface'], cell_id)
+            time_data_stamp = hdf[f'{base}/Time Date Stamp'][:]
+
+        timestamps = AwsRasTools._parse_time_stamps(time_data_stamp)
+        return pd.Series(water_surface, index=pd.DatetimeIndex(timestamps, name='time'), name=cell_id)
 
     @staticmethod
-    def extract_time_data_stamp(hdf_path):
+    def _downsample_index(time_values, values, max_points):
         """
-        Extract time data stamp from HEC-RAS HDF5 file.
+        Pick the indices of at most max_points samples that keep the visual shape of a series.
 
         Parameters:
-        hdf_path (str): Path to the HEC-RAS HDF5 file
+        time_values (numpy.ndarray): datetime64 x values
+        values (numpy.ndarray): y values
+        max_points (int): Target number of points, or None to keep every point
 
         Returns:
-        pandas.DataFrame: DataFrame containing timestamps
-        """
-        from datetime import datetime
-
-        def parse_ras_datetime(date_string):
-            return datetime.strptime(date_string, "%d%b%Y %H:%M:%S")
-
-        with h5py.File(hdf_path, 'r') as hdf:
-            time_data_stamp = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Time Date Stamp'][:]
-
-        timestamps = [parse_ras_datetime(ts.decode('utf-8').strip()) for ts in time_data_stamp]
-        return pd.DataFrame({'Timestamp': timestamps})
+        numpy.ndarray: Sorted indices into the series
+        """
+        n = len(values)
+        if max_points is None or n <= max_points:
+            return np.arange(n)
+        if MinMaxLTTBDownsampler is not None:
+            x = time_values.astype('datetime64[ns]').astype(np.int64)
+            return np.asarray(MinMaxLTTBDownsampler().downsample(x, values, n_out=max_points))
+
+        # Keep the min and max of each equal-width bucket (and of the short tail), plus both end points
+        buckets = max(1, (max_points - 4) // 2)
+        size = n // buckets
+        blocks = values[:buckets * size].reshape(buckets, size)
+        offsets = np.arange(buckets) * size
+        keep = [[0, n - 1], offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1)]
+        tail = values[buckets * size:]
+        if len(tail):
+            keep.append([buckets * size + tail.argmin(), buckets * size + tail.argmax()])
+        return np.unique(np.concatenate(keep))
 
     @staticmethod
-    def extract_water_surface_and_flow(hdf_path, station_target):
+    def plot_wsel_timeseries(hdf_paths, specific_cell_id=767, mesh_name='BaldEagleCr', max_points=2000):
         """
-        Extract water surface and flow data for a specific station from HEC-RAS HDF5 file.
+        Plots the water surface elevation time series for a specific cell ID from multiple HDF files with different infiltration rates.
+
+        The files are read concurrently, one thread per file (up to 8), and only the
+        requested cell's column is pulled from each.
 
         Parameters:
-        hdf_path (str): Path to the HEC-RAS HDF5 file
-        station_target (float): Target station value
+        hdf_paths (dict): Dictionary containing infiltration rates as keys and corresponding HDF file paths as values.
+        specific_cell_id (int): The specific cell ID to plot the time series for. Default is 767.
+        mesh_name (str): Name of the 2D flow area holding the cell. Default is 'BaldEagleCr'.
+        max_points (int): Most points drawn per line; longer series are downsampled for plotting
+            (MinMaxLTTB when tsdownsample is installed, per-bucket min/max otherwise). Peaks and
+            statistics always use the full series. None plots every point. Default is 2000.
 
         Returns:
-        pandas.DataFrame: DataFrame containing timestamps, water surface, and flow data
-        """
-        with h5py.File(hdf_path, 'r') as hdf:
-            water_surface = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections/Water Surface'][:]
-            flow = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections/Flow'][:]
-            cross_section_attrs = hdf['/Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series/Cross Sections/Cross Section Attributes'][:]
+        matplotlib.figure.Figure: The plotted figure; close it with plt.close(fig) when running
+            sweeps so figures do not accumulate in pyplot
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(hdf_paths)))) as executor:
+            series = executor.map(lambda path: AwsRasTools._read_cell(path, specific_cell_id, mesh_name), hdf_paths.values())
+            timeseries_data = dict(zip(hdf_paths.keys(), series))
+
+        # Peak, min and mean are computed once per series and reused for the plot and the printout.
+        # Runs of one sweep share their output times, so the series are stacked and reduced together;
+        # series of different lengths are reduced one at a time.
+        rates = list(timeseries_data)
+        series_values = [timeseries_data[rate].to_numpy() for rate in rates]
+        if len({len(values) for values in series_values}) == 1:
+            stacked = np.stack(series_values)
+            peak_indices = stacked.argmax(axis=1)
+            peaks = stacked[np.arange(len(rates)), peak_indices]
+            min_values = stacked.min(axis=1)
+            mean_values = stacked.mean(axis=1)
+        else:
+            peak_indices = [values.argmax() for values in series_values]
+            peaks = [values[peak_index] for values, peak_index in zip(series_values, peak_indices)]
+            min_values = [values.min() for values in series_values]
+            mean_values = [values.mean() for values in series_values]
+        stats = {
+            rate: (timeseries_data[rate].index.values, int(peak_index), float(peak_value), float(min_value), float(mean_value))
+            for rate, peak_index, peak_value, min_value, mean_value in zip(rates, peak_indices, peaks, min_values, mean_values)
+        }
+
+        fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+
+        # Draw every rate's line as one LineCollection and all peaks as one scatter, so the
+        # axes are autoscaled once rather than once per artist
+        colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        segments, line_colors, peak_times, peak_values, legend_handles = [], [], [], [], []
+        for number, (rate, wsel_timeseries) in enumerate(timeseries_data.items()):
+            time_values, peak_index, peak_value, _, _ = stats[rate]
+            color = colors[number % len(colors)]
+            line_colors.append(color)
+
+            plot_index = AwsRasTools._downsample_index(time_values, wsel_timeseries.to_numpy(), max_points)
+            segments.append(np.column_stack((mdates.date2num(time_values[plot_index]), wsel_timeseries.to_numpy()[plot_index])))
+            peak_times.append(time_values[peak_index])
+            peak_values.append(peak_value)
+            legend_handles.append(Line2D([], [], color=color, label=f'Cell ID: {specific_cell_id}, Rate: {rate}'))
+            legend_handles.append(Line2D([], [], color=color, marker='o', markersize=10, linestyle='', label=f'Peak at Rate: {rate}'))
+
+        ax.add_collection(LineCollection(segments, colors=line_colors))
+        ax.scatter(peak_times, peak_values, s=100, zorder=5, c=line_colors)
+        ax.xaxis_date()
+        ax.autoscale_view()
+
+        for peak_time, peak_value in zip(peak_times, peak_values):
+            ax.annotate(f'Peak: {peak_value:.2f} ft', 
+                        (peak_time, peak_value),
+                        xytext=(10, 10), textcoords='offset points',
+                        ha='left', va='bottom',
+                        bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
+                        arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
 
-        cross_section_index = None
-        for index, attr in enumerate(cross_section_attrs):
-            station_value = float(attr['Station'].decode('utf-8').strip())
-            if station_value == station_target:
-                cross_section_index = index
-                break
+        ax.set_title(f'Water Surface Elevation Time Series for Specific Cell (ID: {specific_cell_id})')
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Water Surface Elevation (ft)')
+        ax.legend(handles=legend_handles)
+        ax.grid(True)
 
-        if cross_section_index is None:
-            raise ValueError(f"Station {station_target} not found in cross section attributes.")
+        print(f"Plotted water surface elevation time series for specific cell ID: {specific_cell_id} for all infiltration rates")
 
-        df_timestamps = AwsRasTools.extract_time_data_stamp(hdf_path)
-        
-        df_plot = pd.DataFrame({
-            'Timestamp': df_timestamps['Timestamp'],
-            'Water Surface': water_surface[:, cross_section_index],
-            'Flow': flow[:, cross_section_index]
-        })
+        plt.show()
 
-        return df_plot        
+        for rate, (time_values, peak_index, peak_value, min_value, mean_value) in stats.items():
+            print(f"Statistics for Cell ID {specific_cell_id} at Infiltration Rate {rate}:")
+            print(f"Minimum WSEL: {min_value:.2f} ft")
+            print(f"Maximum WSEL: {peak_value:.2f} ft")
+            print(f"Mean WSEL: {mean_value:.2f} ft")
+            print(f"Time of peak: {time_values[peak_index]}")          
+
+        return fig
+                      
+            
           
           
           